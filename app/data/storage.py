@@ -12,6 +12,7 @@ import os
 import json
 import csv
 import time
+import math
 import datetime
 import sqlite3
 import numpy as np
@@ -19,6 +20,12 @@ import yaml
 from typing import Dict, List, Any, Optional, Tuple, Union, BinaryIO
 from pathlib import Path
 
+# Optional C-accelerated JSON encoder; falls back to the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config import settings
 from utils.logging import get_logger
 
@@ -542,10 +549,46 @@ class DataStorage:
         
         return flat_m
     
+    def _has_non_finite(self, value: Any) -> bool:
+        """
+        Check whether data holds NaN or infinite floats.
+        
+        Args:
+            value: Data to check
+            
+        Returns:
+            bool: True if any float in the data is not finite
+        """
+        if isinstance(value, float):
+            return not math.isfinite(value)
+        if isinstance(value, dict):
+            values = value.values()
+        elif isinstance(value, (list, tuple)):
+            values = value
+        elif isinstance(value, np.ndarray):
+            if value.dtype.kind == 'O':
+                return any(map(self._has_non_finite, value.flat))
+            return value.dtype.kind in 'fc' and not np.isfinite(value).all()
+        elif isinstance(value, np.floating):
+            return not np.isfinite(value)
+        else:
+            return False
+        
+        try:
+            # Containers of plain numbers are summed in C; NaN and infinity
+            # carry through the sum. An overflow only costs a slower save.
+            return not math.isfinite(sum(values))
+        except (TypeError, ValueError, OverflowError):
+            # Nested or non-numeric values
+            return any(map(self._has_non_finite, values))
+    
     def _save_json(self, data: Dict[str, Any], filepath: Path) -> str:
         """
         Save data to JSON format.
         
+        orjson writes NaN and Infinity as null, so data holding non-finite
+        floats is written with the standard library encoder instead.
+        
         Args:
             data: Data to save
             filepath: Path to save the file
@@ -557,6 +600,24 @@ class DataStorage:
             # Create parent directories if needed
             filepath.parent.mkdir(parents=True, exist_ok=True)
             
+            # orjson would write NaN and Infinity as null
+            if orjson is not None and not self._has_non_finite(data):
+                # orjson serializes numpy arrays and datetimes natively; the
+                # default hook covers arrays it cannot take directly
+                def default(obj):
+                    if isinstance(obj, (np.ndarray, np.generic)):
+                        return obj.tolist()
+                    raise TypeError
+                
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(
+                        data, default=default,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    ))
+                
+                logger.info(f"Saved JSON data to {filepath}")
+                return str(filepath)
+            
             # Use a custom serializer to handle numpy arrays and other non-serializable types
             class NumpyEncoder(json.JSONEncoder):
                 def default(self, obj):
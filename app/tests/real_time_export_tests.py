@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Real-Time Plot Export Tests for SpectroNeph
+
+Checks that RealTimeDataMonitor.export_plot_async writes PNG files of the
+size the figure renders at, including sizes where inches x dpi is not a
+whole number of pixels. Runs without hardware.
+
+Usage:
+    python real_time_export_tests.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+# Add the app directory to the Python path
+app_root = Path(__file__).resolve().parent.parent
+if str(app_root) not in sys.path:
+    sys.path.insert(0, str(app_root))
+
+from visualization.real_time import RealTimeDataMonitor
+
+def check_export(figsize, dpi):
+    """
+    Export the monitor's figure at the given size and resolution.
+    
+    Args:
+        figsize: Figure size in inches as (width, height)
+        dpi: Export resolution in dots per inch
+    """
+    monitor = RealTimeDataMonitor()
+    fig = monitor.get_figure()
+    fig.set_size_inches(*figsize)
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        filename = str(Path(output_dir) / "export.png")
+        assert monitor.export_plot_async(filename, dpi=dpi).result(timeout=30)
+        
+        # The image has the figure's size in pixels, rounded as Agg does
+        image = plt.imread(filename)
+        width, height = (round(size) for size in fig.get_size_inches() * dpi)
+        assert image.shape[:2] == (height, width), image.shape
+    
+    plt.close(fig)
+
+def test_export_whole_pixel_size():
+    """Export a figure whose size is a whole number of pixels."""
+    check_export((8.0, 6.0), 100)
+
+def test_export_fractional_pixel_size():
+    """Export a figure whose inches x dpi falls just below a whole pixel."""
+    # 5.1 * 100 is 509.99999999999994 in floating point; Agg renders 510 rows
+    check_export((7.3, 5.1), 100)
+
+def main():
+    """Run all export tests."""
+    tests = [test_export_whole_pixel_size, test_export_fractional_pixel_size]
+    for test in tests:
+        test()
+        print(f"{test.__name__}: OK")
+    print("All export tests passed")
+
+if __name__ == "__main__":
+    main()
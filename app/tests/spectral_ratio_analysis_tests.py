@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Spectral Ratio Analysis Tests for SpectroNeph
+
+Checks the condition handling of data_analysis/spectral_ratio_analysis.py
+on small artificial datasets, including measurements whose salt
+concentration or time point could not be parsed from the filename.
+
+Usage:
+    python spectral_ratio_analysis_tests.py
+"""
+
+import io
+import sys
+import contextlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+# Add the data analysis scripts to the Python path
+analysis_root = Path(__file__).resolve().parent.parent.parent / "data_analysis"
+if str(analysis_root) not in sys.path:
+    sys.path.insert(0, str(analysis_root))
+
+import spectral_ratio_analysis as sra
+
+def make_condition_data():
+    """
+    Create ratio data for three conditions, one with an unknown salt level.
+    
+    Returns:
+        DataFrame with categorical condition columns, as load_data returns them
+    """
+    data = pd.DataFrame({
+        'salt_percent': [0.0, 0.0, 50.0, 50.0, np.nan, np.nan],
+        'time_min': [0, 0, 5, 5, 5, 5],
+        '515nm_630nm': [1.0, 1.2, 2.0, 2.2, 3.0, 3.4],
+    })
+    sra._categorize_conditions(data)
+    return data
+
+def test_ratio_comparison_keeps_nan_conditions():
+    """Rows with an unknown condition get their own box, labelled nan."""
+    fig, ax = plt.subplots()
+    try:
+        sra.plot_ratio_comparison(make_condition_data(), ax)
+        labels = [label.get_text() for label in ax.get_xticklabels()]
+    finally:
+        plt.close(fig)
+    
+    assert labels == ['0.0% salt\n0 min', '50.0% salt\n5 min', 'nan% salt\n5 min'], labels
+
+def test_agglutination_skips_nan_salt():
+    """Measurements with an unknown salt level are not reported as a condition."""
+    data = pd.DataFrame({
+        'salt_percent': [0.0, 0.0, np.nan, np.nan],
+        'time_min': [0, 5, 0, 5],
+        '515nm_630nm': [1.0, 1.5, 2.0, 3.0],
+    })
+    sra._categorize_conditions(data)
+    
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        sra.analyze_agglutination(data)
+    
+    assert "0.0% Salt Condition" in output.getvalue()
+    assert "nan% Salt Condition" not in output.getvalue(), output.getvalue()
+
+def main():
+    """Run all spectral ratio analysis tests."""
+    tests = [test_ratio_comparison_keeps_nan_conditions, test_agglutination_skips_nan_salt]
+    for test in tests:
+        test()
+        print(f"{test.__name__}: OK")
+    print("All spectral ratio analysis tests passed")
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,29 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import PolyCollection
 import matplotlib
 from typing import Dict, List, Any, Optional, Tuple, Union, Callable
 import time
-import threading
-import queue
+import io
+import math
+import operator
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from utils.logging import get_logger
 
+# Optional JIT compiler for the statistics kernel; falls back to NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional NaN-aware C reductions, used for statistics when Numba is missing
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
 # Set the backend to a non-interactive one if running headless
 # matplotlib.use('Agg')
 
@@ -31,6 +46,130 @@ from visualization.plots import (
     create_time_series
 )
 
+# Queued by RealTimeSpectralPlot.clear() to reset the plot in order with data
+_CLEAR_REQUEST = object()
+
+# Channels and ratios summarized by RealTimeDataMonitor.show_statistics
+STAT_CHANNELS = ("F1", "F4", "F8")
+STAT_RATIOS = ("violet_red", "violet_green", "green_red")
+
+# Shared default for measurements without a "raw" or "ratios" dict; never modified
+_EMPTY = {}
+
+# Lines of the configuration panel as (label, config key, unit)
+CONFIG_FIELDS = (
+    ("Gain", "gain", "x"),
+    ("Integration Time", "integration_time", "ms"),
+    ("LED Current", "led_current", "mA")
+)
+
+def _column_sums(column: np.ndarray) -> Tuple[int, float, float, float, float]:
+    """
+    Count, sum, sum of squares, minimum and maximum of a column in one pass.
+    
+    NaN entries mark missing values and are skipped.
+    """
+    count = 0
+    total = 0.0
+    total_sq = 0.0
+    low = np.inf
+    high = -np.inf
+    for i in range(column.shape[0]):
+        value = np.float64(column[i])  # Square in float64, not the column's dtype
+        if value == value:
+            count += 1
+            total += value
+            total_sq += value * value
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+    return count, total, total_sq, low, high
+
+if njit is not None:
+    # Everything but the no-NaN assumption, which the skip above relies on
+    # Compiled on the first show_statistics call, not at import
+    _stats_kernel = njit(fastmath={"reassoc", "contract", "arcp", "nsz"})(_column_sums)
+else:
+    _stats_kernel = None
+
+def _column_stats(column: np.ndarray) -> Tuple[int, float, float, float, float]:
+    """
+    Statistics of the non-NaN values in a column.
+    
+    Sums are accumulated in float64 whatever the column's dtype, except on
+    the bottleneck path, which accumulates in the column's own dtype.
+    
+    Args:
+        column: Values, with NaN marking missing entries
+        
+    Returns:
+        Tuple of (count, mean, std, min, max); count is 0 if no value is present
+    """
+    if _stats_kernel is not None:
+        count, total, total_sq, low, high = _stats_kernel(column)
+        if not count:
+            return 0, np.nan, np.nan, np.nan, np.nan
+        mean = total / count
+        return count, mean, math.sqrt(max(total_sq / count - mean * mean, 0.0)), low, high
+    
+    if bn is not None:
+        # Reduce the column as it is, skipping NaN, instead of copying out the
+        # present values. For a float32 ring of at most a few thousand 16-bit
+        # counts, float32 sums stay within about 1e-6 of the float64 ones.
+        count = column.size - np.count_nonzero(np.isnan(column))
+        if not count:
+            return 0, np.nan, np.nan, np.nan, np.nan
+        return (count, float(bn.nanmean(column)), float(bn.nanstd(column)),
+                float(bn.nanmin(column)), float(bn.nanmax(column)))
+    
+    values = column[~np.isnan(column)]
+    if not values.size:
+        return 0, np.nan, np.nan, np.nan, np.nan
+    return (values.size, float(values.mean(dtype=np.float64)), float(values.std(dtype=np.float64)),
+            float(values.min()), float(values.max()))
+
+class SlidingWindowMax:
+    """
+    Running maximum over the most recent values of a stream.
+    
+    Uses a monotonic deque, so each pushed value costs amortized O(1) and
+    the current maximum is available without scanning the window.
+    """
+    
+    def __init__(self, window: int):
+        """
+        Initialize the sliding window maximum.
+        
+        Args:
+            window: Number of most recent values the maximum is taken over
+        """
+        self.window = window
+        self._count = 0
+        self._candidates = deque()  # (index, value), values strictly decreasing
+    
+    def push(self, value: float):
+        """
+        Add a new value to the window.
+        
+        Args:
+            value: Newest value in the stream
+        """
+        # Drop candidates that can never be the maximum again
+        while self._candidates and self._candidates[-1][1] <= value:
+            self._candidates.pop()
+        self._candidates.append((self._count, value))
+        self._count += 1
+        
+        # Drop the front candidate once it falls out of the window
+        if self._candidates[0][0] <= self._count - 1 - self.window:
+            self._candidates.popleft()
+    
+    @property
+    def max(self) -> Optional[float]:
+        """Maximum of the values in the window, or None if empty."""
+        return self._candidates[0][1] if self._candidates else None
+
 class RealTimeSpectralPlot:
     """
     Real-time updating spectral plot.
@@ -58,9 +197,6 @@ class RealTimeSpectralPlot:
         # Data buffer for time series
         self.data_buffer = deque(maxlen=buffer_size)
         
-        # Latest spectral data
-        self.latest_spectral_data = {}
-        
         # Setup plot
         self.fig = plt.figure(figsize=figsize)
         
@@ -79,14 +215,57 @@ class RealTimeSpectralPlot:
         self._init_ratios_axis()
         self._init_status_axis()
         
+        # Contiguous sample buffers (one row per measurement)
+        self._reset_buffers()
+        
+        # Artists updated by the animation, in the order they are returned
+        self._artists = (
+            [self.spectral_bars] + 
+            [self.spectral_line] + 
+            list(self.spectral_labels) + 
+            list(self.time_series_lines.values()) + 
+            list(self.ratio_lines.values()) + 
+            [self.status_text, self.stats_text, self.config_text]
+        )
+        
+        # Set when new data has been processed but not yet drawn
+        self._dirty = False
+        
+        # The status panel is human-readable, so it refreshes at most once per
+        # status_interval seconds; _status_stale marks a skipped refresh
+        self.status_interval = 1.0
+        self._last_status_update = 0.0
+        self._status_stale = False
+        
+        # Formatted wall-clock time, reformatted only when the second changes
+        self._last_second = None
+        self._time_str = ""
+        
+        # Copy of the config currently shown, so the configuration panel is
+        # only reformatted when the settings actually change
+        self._last_config = {}
+        
         # Animation control
         self.animation = None
         self.running = False
         self.paused = False
         
-        # Thread-safe queue for data updates
-        self.data_queue = queue.Queue()
-        self.lock = threading.Lock()
+        # Bounded mailbox for data updates. deque.append and deque.popleft are
+        # atomic in CPython, so add_data and the animation need no lock, and a
+        # stalled renderer drops the oldest updates instead of growing memory.
+        # Anything older than buffer_size samples would be evicted from the
+        # plot buffers anyway.
+        self.data_queue = deque(maxlen=buffer_size)
+        
+        # Only the animation thread touches buffers and artists. clear() queues
+        # _CLEAR_REQUEST and also sets this flag, in case the request is pushed
+        # out of the bounded mailbox before it is drained.
+        self._clear_pending = False
+        
+        # Timestamp of the first sample added since the last clear. It is
+        # recorded as data is added, so samples evicted from the mailbox
+        # before they are drawn do not move the start of the time axis.
+        self._origin = None
 
     def _init_spectral_axis(self):
         """Initialize the spectral profile axis."""
@@ -97,11 +276,25 @@ class RealTimeSpectralPlot:
         
         # Initialize empty bars for each channel
         self.channels = [f"F{i}" for i in range(1, 9)]
-        wavelengths = [CHANNEL_WAVELENGTHS[ch] for ch in self.channels]
-        self.spectral_bars = self.ax_spectral.bar(
-            wavelengths, [0] * len(self.channels),
-            width=20, color=[CHANNEL_COLORS[ch] for ch in self.channels], alpha=0.7
+        self._wavelengths = np.array([CHANNEL_WAVELENGTHS[ch] for ch in self.channels])
+        wavelengths = self._wavelengths
+        
+        # Latest value of each channel, overwritten in place as data arrives
+        self._spec_values = np.zeros(len(self.channels))
+        
+        # Fetches all channel values from a complete raw dict in one C call
+        self._chan_getter = operator.itemgetter(*self.channels)
+        
+        # All bars live in one collection so a frame updates a single artist.
+        # Vertices run (left, 0), (left, h), (right, h), (right, 0) per bar.
+        self._bar_verts = np.zeros((len(self.channels), 4, 2))
+        self._bar_verts[:, :, 0] = wavelengths[:, np.newaxis] + np.array([-10, -10, 10, 10])
+        self.spectral_bars = PolyCollection(
+            self._bar_verts,
+            facecolors=[CHANNEL_COLORS[ch] for ch in self.channels],
+            linewidths=0, alpha=0.7
         )
+        self.ax_spectral.add_collection(self.spectral_bars, autolim=False)
         
         # Add connecting line
         self.spectral_line, = self.ax_spectral.plot(
@@ -114,15 +307,17 @@ class RealTimeSpectralPlot:
         # Set x-axis range to cover all wavelengths with padding
         self.ax_spectral.set_xlim(400, 700)
         
-        # Add channel labels
+        # Add channel labels along the bottom of the axis; they stay fixed
+        # so the bars can be updated without moving eight text artists
+        label_transform = self.ax_spectral.get_xaxis_transform()
         for i, ch in enumerate(self.channels):
             self.ax_spectral.text(
-                wavelengths[i], 0, ch,
+                wavelengths[i], 0.01, ch,
                 ha='center', va='bottom', fontsize=9,
-                color='black'
+                color='black', transform=label_transform
             )
         
-        # Store the channel labels for updating
+        # Store the channel labels
         self.spectral_labels = self.ax_spectral.texts[-len(self.channels):]
 
     def _init_time_series_axis(self):
@@ -134,8 +329,7 @@ class RealTimeSpectralPlot:
         
         # Initialize empty time series for key channels
         self.key_channels = ['F1', 'F4', 'F8']  # Violet, Green, Red
-        self.time_data = []
-        self.channel_data = {ch: [] for ch in self.key_channels}
+        self._key_getter = operator.itemgetter(*self.key_channels)
         
         # Create line objects for each channel
         self.time_series_lines = {}
@@ -164,19 +358,15 @@ class RealTimeSpectralPlot:
         self.ax_ratios.set_ylabel('Ratio Value')
         self.ax_ratios.grid(True, alpha=0.3)
         
-        # Initialize empty ratio time series
-        self.ratio_data = {
-            'violet_red': [],
-            'violet_green': [],
-            'green_red': []
-        }
+        # Ratios shown in the time series
+        self.ratio_types = ['violet_red', 'violet_green', 'green_red']
         
         # Create line objects for each ratio
         self.ratio_lines = {}
         colors = ['purple', 'teal', 'orange']
         labels = ['Violet/Red', 'Violet/Green', 'Green/Red']
         
-        for i, (ratio, label) in enumerate(zip(self.ratio_data.keys(), labels)):
+        for i, (ratio, label) in enumerate(zip(self.ratio_types, labels)):
             line, = self.ax_ratios.plot(
                 [], [], 'o-', 
                 label=label,
@@ -230,6 +420,40 @@ class RealTimeSpectralPlot:
             ha='left', va='top', fontsize=10
         )
 
+    def _reset_buffers(self):
+        """Allocate empty sample buffers for the time series and ratio plots."""
+        # Structure-of-arrays layout: one row per sample, one column per series.
+        # Rows are written in ring order at index self._head % buffer_size.
+        # Channels hold 16-bit AS7341 ADC counts; elapsed time stays float64
+        # so sub-second steps remain exact in long sessions.
+        self._time_buf = np.zeros(self.buffer_size)
+        self._chan_buf = np.zeros((self.buffer_size, len(self.key_channels)), dtype=np.uint16)
+        self._ratio_buf = np.zeros((self.buffer_size, len(self.ratio_types)), dtype=np.float32)
+        self._head = 0  # Total number of samples written
+        
+        # Running maxima over the samples currently held in the buffers
+        self._chan_max = SlidingWindowMax(self.buffer_size)
+        self._ratio_max = SlidingWindowMax(self.buffer_size)
+        self._time_arr = self._time_buf[:0]  # Chronological view, see _update_plot
+
+    def _ring_view(self, buf: np.ndarray) -> np.ndarray:
+        """
+        Get the valid rows of a sample buffer in chronological order.
+        
+        Args:
+            buf: One of the sample buffers
+            
+        Returns:
+            Array with the oldest sample first
+        """
+        # Until the ring wraps the rows are already in order and a view suffices
+        if self._head <= self.buffer_size:
+            return buf[:self._head]
+        
+        # Stitch the two halves of the ring around the write position
+        split = self._head % self.buffer_size
+        return np.concatenate((buf[split:], buf[:split]))
+
     def start(self, plt_show: bool = True):
         """
         Start the real-time visualization.
@@ -284,199 +508,234 @@ class RealTimeSpectralPlot:
         Returns:
             List of updated artists
         """
-        with self.lock:
-            # Process any new data in the queue
-            self._process_queue()
-            
-            # Update spectral profile
-            self._update_spectral_plot()
-            
-            # Update time series
-            self._update_time_series_plot()
-            
-            # Update ratios
-            self._update_ratios_plot()
-            
-            # Update status
-            self._update_status_plot()
+        # Process any new data in the queue
+        self._process_queue()
         
-        # Return a list of all updated artists
-        artists = (
-            list(self.spectral_bars) + 
-            [self.spectral_line] + 
-            list(self.spectral_labels) + 
-            list(self.time_series_lines.values()) + 
-            list(self.ratio_lines.values()) + 
-            [self.status_text, self.stats_text, self.config_text]
-        )
+        # Nothing has changed since the last frame
+        if not self._dirty:
+            # Catch up on a status refresh skipped by the throttle
+            if self._status_stale:
+                self._update_status_plot()
+            return self._artists
+        
+        # Chronological time axis, shared by the time series and ratio plots
+        self._time_arr = self._ring_view(self._time_buf)
         
-        return artists
+        # Update spectral profile
+        self._update_spectral_plot()
+        
+        # Update time series
+        self._update_time_series_plot()
+        
+        # Update ratios
+        self._update_ratios_plot()
+        
+        # Update status
+        self._update_status_plot()
+        
+        self._dirty = False
+        
+        return self._artists
 
     def _process_queue(self):
         """Process any new data in the queue."""
-        while not self.data_queue.empty():
-            try:
-                # Get new data
-                data = self.data_queue.get_nowait()
-                
-                # Process the data
-                self._process_data(data)
-                
-                # Mark as done
-                self.data_queue.task_done()
-            except queue.Empty:
+        # Take exactly the items queued so far. Checking the length once keeps
+        # a fast producer from holding the animation thread in this loop.
+        popleft = self.data_queue.popleft
+        batch = [popleft() for _ in range(len(self.data_queue))]
+        
+        # Apply a clear request, dropping everything queued before it. If the
+        # request itself was evicted, everything left was queued after it.
+        cleared = self._clear_pending
+        self._clear_pending = False
+        for i in range(len(batch) - 1, -1, -1):
+            if batch[i] is _CLEAR_REQUEST:
+                batch = batch[i + 1:]
+                cleared = True
                 break
+        
+        if cleared:
+            self._reset_display()
+        
+        if batch:
+            self._process_batch(batch)
 
-    def _process_data(self, data):
+    def _process_batch(self, batch: List[Dict[str, Any]]):
         """
         Process new data and update internal buffers.
         
+        Ratios and buffer writes are computed for the whole batch at once.
+        
         Args:
-            data: New measurement data
+            batch: New measurement data, oldest first
         """
-        # Extract timestamp
-        timestamp = data.get('timestamp', time.time())
+        now = time.time()
         
-        # Convert to elapsed time if this is the first measurement
-        if not self.time_data:
-            self.start_time = timestamp
-            elapsed = 0
-        else:
-            elapsed = timestamp - self.start_time
+        # Convert to elapsed time relative to the first measurement
+        if self._head == 0:
+            origin = self._origin
+            self.start_time = batch[0].get('timestamp', now) if origin is None else origin
         
-        # Store the elapsed time
-        self.time_data.append(elapsed)
+        # Only the newest buffer_size samples can still be shown
+        shown = batch[-self.buffer_size:]
+        n = len(shown)
         
-        # Extract raw data
-        raw_data = data.get('raw', data)
+        # Extract timestamps and raw data
+        timestamps = np.array([data.get('timestamp', now) for data in shown], dtype=float)
+        raw_data = [data.get('raw', data) for data in shown]
         
-        # Update latest spectral data
-        self.latest_spectral_data = raw_data.copy()
+        # Channel values, NaN where a channel is missing
+        try:
+            key_getter = self._key_getter
+            chan_values = np.array([key_getter(raw) for raw in raw_data], dtype=float)
+        except KeyError:
+            chan_values = np.array(
+                [[raw.get(ch, np.nan) for ch in self.key_channels] for raw in raw_data],
+                dtype=float
+            )
         
-        # Update channel data
-        for ch in self.key_channels:
-            if ch in raw_data:
-                self.channel_data[ch].append(raw_data[ch])
-            else:
-                self.channel_data[ch].append(0)
+        # Calculate ratios for measurements that do not carry them. A ratio
+        # involving a missing channel comes out as NaN.
+        f1, f4, f8 = (chan_values[:, self.key_channels.index(ch)] for ch in ('F1', 'F4', 'F8'))
+        ratio_values = np.column_stack((
+            f1 / np.maximum(1, f8),  # violet_red
+            f1 / np.maximum(1, f4),  # violet_green
+            f4 / np.maximum(1, f8)   # green_red
+        ))
+        for i, data in enumerate(shown):
+            if 'ratios' in data:
+                ratio_values[i] = [data['ratios'].get(ratio, np.nan) for ratio in self.ratio_types]
+        
+        # Missing channels and ratios are plotted as 0
+        np.nan_to_num(chan_values, copy=False)
+        np.nan_to_num(ratio_values, copy=False)
+        
+        # Keep channel values inside the range of the 16-bit buffer
+        np.clip(chan_values, 0, np.iinfo(np.uint16).max, out=chan_values)
+        
+        # Write the rows into the sample buffers
+        rows = (self._head + np.arange(n)) % self.buffer_size
+        self._time_buf[rows] = timestamps - self.start_time
+        self._chan_buf[rows] = chan_values
+        self._ratio_buf[rows] = ratio_values
+        self._head += n
+        
+        for value in chan_values.max(axis=1):
+            self._chan_max.push(value)
+        for value in ratio_values.max(axis=1):
+            self._ratio_max.push(value)
         
-        # Calculate ratios if not present
-        if 'ratios' not in data:
-            ratios = {}
-            if 'F1' in raw_data and 'F8' in raw_data:
-                ratios['violet_red'] = raw_data['F1'] / max(1, raw_data['F8'])
-            
-            if 'F1' in raw_data and 'F4' in raw_data:
-                ratios['violet_green'] = raw_data['F1'] / max(1, raw_data['F4'])
-            
-            if 'F4' in raw_data and 'F8' in raw_data:
-                ratios['green_red'] = raw_data['F4'] / max(1, raw_data['F8'])
-        else:
-            ratios = data['ratios']
-        
-        # Update ratio data
-        for ratio in self.ratio_data:
-            if ratio in ratios:
-                self.ratio_data[ratio].append(ratios[ratio])
-            else:
-                self.ratio_data[ratio].append(0)
+        # Update latest spectral data
+        latest = raw_data[-1]
+        try:
+            self._spec_values[:] = self._chan_getter(latest)
+        except KeyError:
+            for i, ch in enumerate(self.channels):
+                self._spec_values[i] = latest.get(ch, 0)
         
         # Add to buffer
-        self.data_buffer.append(data)
+        self.data_buffer.extend(batch)
+        
+        self._dirty = True
 
     def _update_spectral_plot(self):
         """Update the spectral profile plot."""
         # Get values for each channel
-        values = []
-        for i, ch in enumerate(self.channels):
-            value = self.latest_spectral_data.get(ch, 0)
-            values.append(value)
-            
-            # Update bar height
-            self.spectral_bars[i].set_height(value)
-            
-            # Update label position
-            self.spectral_labels[i].set_y(value + max(values) * 0.03)
+        values = self._spec_values
+        max_value = values.max()
+        
+        # Update all bar heights in one collection update
+        self._bar_verts[:, 1:3, 1] = values[:, np.newaxis]
+        self.spectral_bars.set_verts(self._bar_verts)
         
         # Update line
-        wavelengths = [CHANNEL_WAVELENGTHS[ch] for ch in self.channels]
         self.spectral_line.set_ydata(values)
         
         # Adjust y-axis limits if needed
-        max_value = max(values) if values else 1000
         current_ylim = self.ax_spectral.get_ylim()
         if max_value > current_ylim[1] * 0.9 or max_value < current_ylim[1] * 0.5:
             self.ax_spectral.set_ylim(0, max_value * 1.1)
 
     def _update_time_series_plot(self):
         """Update the time series plot."""
+        if not self._head:
+            return
+        
+        time_arr = self._time_arr
+        chan_arr = self._ring_view(self._chan_buf)
+        
         # Update each channel's line
-        for ch in self.key_channels:
-            if self.time_data and self.channel_data[ch]:
-                self.time_series_lines[ch].set_data(self.time_data, self.channel_data[ch])
+        for i, ch in enumerate(self.key_channels):
+            self.time_series_lines[ch].set_data(time_arr, chan_arr[:, i])
         
         # Adjust x-axis limits to show the most recent data
-        if self.time_data:
-            max_time = max(self.time_data)
-            current_xlim = self.ax_time_series.get_xlim()
-            
-            # If we've gone beyond the current view or have a smaller window than needed
-            if max_time > current_xlim[1] or current_xlim[1] > max_time * 2:
-                # Show the most recent data with a window of appropriate size
-                window_size = min(30, max(10, max_time * 0.5))  # Window of 10-30 seconds
-                self.ax_time_series.set_xlim(max(0, max_time - window_size), max_time + 1)
-            
-            # Adjust y-axis limits if needed
-            all_values = []
-            for ch in self.key_channels:
-                if self.channel_data[ch]:
-                    all_values.extend(self.channel_data[ch])
-            
-            if all_values:
-                max_value = max(all_values)
-                current_ylim = self.ax_time_series.get_ylim()
-                if max_value > current_ylim[1] * 0.9 or max_value < current_ylim[1] * 0.5:
-                    self.ax_time_series.set_ylim(0, max_value * 1.1)
+        max_time = time_arr.max()
+        current_xlim = self.ax_time_series.get_xlim()
+        
+        # If we've gone beyond the current view or have a smaller window than needed
+        if max_time > current_xlim[1] or current_xlim[1] > max_time * 2:
+            # Show the most recent data with a window of appropriate size
+            window_size = min(30, max(10, max_time * 0.5))  # Window of 10-30 seconds
+            self.ax_time_series.set_xlim(max(0, max_time - window_size), max_time + 1)
+        
+        # Adjust y-axis limits if needed
+        max_value = self._chan_max.max
+        current_ylim = self.ax_time_series.get_ylim()
+        if max_value > current_ylim[1] * 0.9 or max_value < current_ylim[1] * 0.5:
+            self.ax_time_series.set_ylim(0, max_value * 1.1)
 
     def _update_ratios_plot(self):
         """Update the ratios plot."""
+        if not self._head:
+            return
+        
+        time_arr = self._time_arr
+        ratio_arr = self._ring_view(self._ratio_buf)
+        
         # Update each ratio's line
-        for ratio, line in self.ratio_lines.items():
-            if self.time_data and self.ratio_data[ratio]:
-                line.set_data(self.time_data, self.ratio_data[ratio])
+        for i, ratio in enumerate(self.ratio_types):
+            self.ratio_lines[ratio].set_data(time_arr, ratio_arr[:, i])
         
-        # Adjust x-axis limits to match the time series plot
-        if self.time_data:
-            self.ax_ratios.set_xlim(self.ax_time_series.get_xlim())
-            
-            # Adjust y-axis limits if needed
-            all_values = []
-            for ratio in self.ratio_data:
-                if self.ratio_data[ratio]:
-                    all_values.extend(self.ratio_data[ratio])
-            
-            if all_values:
-                max_value = max(all_values)
-                current_ylim = self.ax_ratios.get_ylim()
-                if max_value > current_ylim[1] * 0.9 or max_value < current_ylim[1] * 0.5:
-                    self.ax_ratios.set_ylim(0, max(5, max_value * 1.1))
+        # Adjust x-axis limits to match the time series plot. set_xlim always
+        # invalidates the axis transforms, so only call it on a real change.
+        xlim = self.ax_time_series.get_xlim()
+        if self.ax_ratios.get_xlim() != xlim:
+            self.ax_ratios.set_xlim(xlim)
+        
+        # Adjust y-axis limits if needed
+        max_value = self._ratio_max.max
+        current_ylim = self.ax_ratios.get_ylim()
+        if max_value > current_ylim[1] * 0.9 or max_value < current_ylim[1] * 0.5:
+            self.ax_ratios.set_ylim(0, max(5, max_value * 1.1))
 
     def _update_status_plot(self):
         """Update the status plot."""
+        # Throttle the refresh rate of the panel
+        now = time.time()
+        if now - self._last_status_update < self.status_interval:
+            self._status_stale = True
+            return
+        self._last_status_update = now
+        self._status_stale = False
+        
         # Update status text
         if self.data_buffer:
-            timestamp = time.strftime("%H:%M:%S", time.localtime())
-            status_text = f"Last Update: {timestamp}\nStatus: Running"
+            second = int(now)
+            if second != self._last_second:
+                self._last_second = second
+                self._time_str = time.strftime("%H:%M:%S", time.localtime(second))
+            status_text = f"Last Update: {self._time_str}\nStatus: Running"
             self.status_text.set_text(status_text)
             
             # Update statistics
             latest_data = self.data_buffer[-1]
             raw_data = latest_data.get('raw', latest_data)
             
-            # Find max and min values across channels
-            spectral_values = [raw_data.get(ch, 0) for ch in self.channels if ch in raw_data]
-            max_value = max(spectral_values) if spectral_values else 0
-            min_value = min([v for v in spectral_values if v > 0]) if spectral_values else 0
+            # Find max and min values across channels of the latest measurement
+            spectral_values = self._spec_values
+            positive_values = spectral_values[spectral_values > 0]
+            max_value = spectral_values.max()
+            min_value = positive_values.min() if positive_values.size else 0
             
             # Get violet/red ratio
             violet_red = 0
@@ -488,36 +747,21 @@ class RealTimeSpectralPlot:
             # Update statistics text
             stats_text = (
                 f"Statistics:\n"
-                f"Max Value: {max_value}\n"
-                f"Min Value: {min_value if min_value > 0 else 'N/A'}\n"
+                f"Max Value: {max_value:g}\n"
+                f"Min Value: {f'{min_value:g}' if min_value > 0 else 'N/A'}\n"
                 f"Violet/Red Ratio: {violet_red:.2f}\n"
                 f"Measurements: {len(self.data_buffer)}"
             )
             self.stats_text.set_text(stats_text)
             
-            # Update configuration info if available
-            config_text = "Configuration:\n"
-            if "config" in latest_data:
-                config = latest_data["config"]
-                if "gain" in config:
-                    config_text += f"Gain: {config['gain']}x\n"
-                else:
-                    config_text += "Gain: --\n"
-                
-                if "integration_time" in config:
-                    config_text += f"Integration Time: {config['integration_time']}ms\n"
-                else:
-                    config_text += "Integration Time: --\n"
-                
-                if "led_current" in config:
-                    config_text += f"LED Current: {config['led_current']}mA"
-                else:
-                    config_text += "LED Current: --"
-            else:
-                # Default text if no config available
-                config_text += "Gain: --\nIntegration Time: --\nLED Current: --"
-            
-            self.config_text.set_text(config_text)
+            # Update configuration info if it changed
+            config = latest_data.get("config") or {}
+            if config != self._last_config:
+                self._last_config = dict(config)
+                self.config_text.set_text("Configuration:\n" + "\n".join(
+                    f"{label}: {config[key]}{unit}" if key in config else f"{label}: --"
+                    for label, key, unit in CONFIG_FIELDS
+                ))
 
     def add_data(self, data: Dict[str, Any]):
         """
@@ -526,8 +770,24 @@ class RealTimeSpectralPlot:
         Args:
             data: New measurement data
         """
-        # Add to queue for thread-safe processing
-        self.data_queue.put(data)
+        if self._origin is None:
+            self._origin = data.get('timestamp', time.time())
+        
+        # Add to the mailbox for processing on the animation thread
+        self.data_queue.append(data)
+
+    def add_data_batch(self, data_list: List[Dict[str, Any]]):
+        """
+        Add several measurements to the visualization at once.
+        
+        Args:
+            data_list: New measurement data, oldest first
+        """
+        if self._origin is None and data_list:
+            self._origin = data_list[0].get('timestamp', time.time())
+        
+        # Add to the mailbox for processing on the animation thread
+        self.data_queue.extend(data_list)
 
     def get_figure(self) -> Figure:
         """
@@ -540,42 +800,48 @@ class RealTimeSpectralPlot:
 
     def clear(self):
         """Clear all data and reset the visualization."""
-        with self.lock:
-            # Clear data buffers
-            self.data_buffer.clear()
-            self.latest_spectral_data = {}
-            self.time_data = []
-            self.channel_data = {ch: [] for ch in self.key_channels}
-            self.ratio_data = {ratio: [] for ratio in self.ratio_data}
-            
-            # Reset plots
-            for i in range(len(self.spectral_bars)):
-                self.spectral_bars[i].set_height(0)
-            
-            self.spectral_line.set_ydata([0] * len(self.channels))
-            
-            for ch, line in self.time_series_lines.items():
-                line.set_data([], [])
-            
-            for ratio, line in self.ratio_lines.items():
-                line.set_data([], [])
-            
-            # Reset status
-            self.status_text.set_text("Awaiting data...")
-            self.stats_text.set_text(
-                "Statistics:\n"
-                "Max Value: --\n"
-                "Min Value: --\n"
-                "Violet/Red Ratio: --\n"
-                "Measurements: 0"
-            )
-            self.config_text.set_text(
-                "Configuration:\n"
-                "Gain: --\n"
-                "Integration Time: --\n"
-                "LED Current: --"
-            )
+        # The reset runs on the animation thread, in order with queued data
+        self._origin = None
+        self._clear_pending = True
+        self.data_queue.append(_CLEAR_REQUEST)
 
+    def _reset_display(self):
+        """Clear all data buffers and reset the plots."""
+        # Clear data buffers
+        self.data_buffer.clear()
+        self._spec_values[:] = 0
+        self._reset_buffers()
+        self._dirty = False
+        self._status_stale = False
+        self._last_config = {}
+        
+        # Reset plots
+        self._bar_verts[:, 1:3, 1] = 0
+        self.spectral_bars.set_verts(self._bar_verts)
+        
+        self.spectral_line.set_ydata([0] * len(self.channels))
+        
+        for ch, line in self.time_series_lines.items():
+            line.set_data([], [])
+        
+        for ratio, line in self.ratio_lines.items():
+            line.set_data([], [])
+        
+        # Reset status
+        self.status_text.set_text("Awaiting data...")
+        self.stats_text.set_text(
+            "Statistics:\n"
+            "Max Value: --\n"
+            "Min Value: --\n"
+            "Violet/Red Ratio: --\n"
+            "Measurements: 0"
+        )
+        self.config_text.set_text(
+            "Configuration:\n"
+            "Gain: --\n"
+            "Integration Time: --\n"
+            "LED Current: --"
+        )
 
 class RealTimeDataMonitor:
     """
@@ -602,6 +868,9 @@ class RealTimeDataMonitor:
         # Data buffer
         self.data_buffer = deque(maxlen=buffer_size)
         
+        # Statistics columns, filled at ingest time alongside the data buffer
+        self._reset_statistics()
+        
         # Create the plot
         self.plot = RealTimeSpectralPlot(
             buffer_size=buffer_size,
@@ -623,6 +892,9 @@ class RealTimeDataMonitor:
         self.event_start_time = 0
         self.event_data = []
         
+        # Background PNG encoding for export_plot_async
+        self._export_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="plot_export")
+        
         # Logger
         self.logger = get_logger("real_time_monitor")
 
@@ -652,6 +924,7 @@ class RealTimeDataMonitor:
         
         # Add to the buffer
         self.data_buffer.append(data)
+        self._record_statistics([data])
         
         # Handle recording
         if self.recording:
@@ -661,6 +934,71 @@ class RealTimeDataMonitor:
         if self.detection_enabled:
             self._check_for_events(data)
 
+    def add_data_batch(self, data_list: List[Dict[str, Any]]):
+        """
+        Add several measurements to the monitor at once.
+        
+        Args:
+            data_list: New measurement data, oldest first
+        """
+        # Add to the plot
+        self.plot.add_data_batch(data_list)
+        
+        # Add to the buffer
+        self.data_buffer.extend(data_list)
+        self._record_statistics(data_list)
+        
+        # Handle recording
+        if self.recording:
+            self.recording_data.extend(data_list)
+        
+        # Handle event detection
+        if self.detection_enabled:
+            for data in data_list:
+                self._check_for_events(data)
+
+    def _reset_statistics(self):
+        """Allocate empty statistics columns."""
+        # One ring per key, aligned with data_buffer; NaN marks a missing value.
+        # float32 holds every 16-bit channel count exactly and keeps NaN.
+        self._soa = {
+            key: np.full(self.buffer_size, np.nan, dtype=np.float32)
+            for key in STAT_CHANNELS + STAT_RATIOS
+        }
+        self._n = 0  # Measurements ingested; only the newest buffer_size are kept
+        self._stats_cache = None  # show_statistics result, until new data arrives
+    
+    def _record_statistics(self, data_list: List[Dict[str, Any]]):
+        """
+        Write the statistics columns for new measurements.
+        
+        Args:
+            data_list: New measurement data, oldest first
+        """
+        # Measurements beyond the newest buffer_size would be overwritten at once
+        skipped = max(len(data_list) - self.buffer_size, 0)
+        data_list = data_list[skipped:]
+        self._n += skipped
+        
+        # Fill one row per measurement, then write each column in one go.
+        # map() over the bound dict.get keeps the per-key lookups out of the
+        # interpreter loop; missing keys default to NaN.
+        channel_defaults = (np.nan,) * len(STAT_CHANNELS)
+        ratio_defaults = (np.nan,) * len(STAT_RATIOS)
+        block = np.empty((len(data_list), len(self._soa)))
+        for i, measurement in enumerate(data_list):
+            block[i] = (
+                *map(measurement.get("raw", _EMPTY).get, STAT_CHANNELS, channel_defaults),
+                *map(measurement.get("ratios", _EMPTY).get, STAT_RATIOS, ratio_defaults)
+            )
+        
+        rows = np.arange(self._n, self._n + len(data_list)) % self.buffer_size
+        for j, column in enumerate(self._soa.values()):
+            column[rows] = block[:, j]
+        
+        self._n += len(data_list)
+        self._stats_cache = None
+
     def start_recording(self):
         """Start recording data."""
         if self.recording:
@@ -683,7 +1021,9 @@ class RealTimeDataMonitor:
             return []
         
         self.recording = False
-        recorded_data = self.recording_data.copy()
+        
+        # Hand the list over to the caller and start a fresh one
+        recorded_data = self.recording_data
         self.recording_data = []
         
         self.logger.info("Stopped recording data. Recorded %d measurements.", len(recorded_data))
@@ -777,6 +1117,7 @@ class RealTimeDataMonitor:
     def clear_data(self):
         """Clear all data buffers."""
         self.data_buffer.clear()
+        self._reset_statistics()
         self.recording_data = []
         self.event_data = []
         self.plot.clear()
@@ -854,10 +1195,9 @@ class RealTimeDataMonitor:
             # Clear existing data
             self.clear_data()
             
-            # Add each measurement to the buffer
+            # Add the measurements to the buffer
             measurements = loaded_data["measurements"]
-            for measurement in measurements:
-                self.add_data(measurement)
+            self.add_data_batch(measurements)
             
             self.logger.info("Loaded %d measurements from %s", len(measurements), filename)
             return True
@@ -899,7 +1239,76 @@ class RealTimeDataMonitor:
         """
         try:
             fig = self.get_figure()
-            fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+            
+            # Fit the layout to the figure once, rather than having
+            # bbox_inches='tight' render the whole figure an extra time
+            fig.tight_layout()
+            
+            # Favour encoding speed over file size for PNG
+            save_kwargs = {}
+            if filename.lower().endswith(".png"):
+                save_kwargs["pil_kwargs"] = {"compress_level": 1}
+            
+            fig.savefig(filename, dpi=dpi, **save_kwargs)
+            self.logger.info("Exported plot to %s", filename)
+            return True
+        except Exception as e:
+            self.logger.error("Error exporting plot: %s", str(e))
+            return False
+
+    def export_plot_async(self, filename: str, dpi: int = 300) -> Future:
+        """
+        Export the current plot to an image file in the background.
+        
+        The live figure may only be drawn from one thread, so it is rendered
+        here; for PNG files the encoding and file write then run on a worker
+        thread. Other formats are exported before returning.
+        
+        Args:
+            filename: Output filename
+            dpi: Resolution in dots per inch
+            
+        Returns:
+            Future: Resolves to True if export was successful
+        """
+        if not filename.lower().endswith(".png"):
+            future = Future()
+            future.set_result(self.export_plot(filename, dpi))
+            return future
+        
+        try:
+            fig = self.get_figure()
+            fig.tight_layout()
+            
+            # Render to raw RGBA pixels, the same image savefig would encode.
+            # The canvas keeps the renderer it drew them with, so the pixel
+            # size is read from there; inches x dpi can be off by one.
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="rgba", dpi=dpi)
+            height, width = np.asarray(fig.canvas.buffer_rgba()).shape[:2]
+            pixels = np.frombuffer(buffer.getbuffer(), dtype=np.uint8).reshape(height, width, 4)
+        except Exception as e:
+            self.logger.error("Error exporting plot: %s", str(e))
+            future = Future()
+            future.set_result(False)
+            return future
+        
+        return self._export_pool.submit(self._write_png, pixels, filename, dpi)
+    
+    def _write_png(self, pixels: np.ndarray, filename: str, dpi: int) -> bool:
+        """
+        Encode rendered pixels as a PNG file.
+        
+        Args:
+            pixels: RGBA image as a (height, width, 4) uint8 array
+            filename: Output filename
+            dpi: Resolution in dots per inch, stored in the file
+            
+        Returns:
+            bool: True if export was successful
+        """
+        try:
+            plt.imsave(filename, pixels, dpi=dpi, pil_kwargs={"compress_level": 1})
             self.logger.info("Exported plot to %s", filename)
             return True
         except Exception as e:
@@ -910,12 +1319,18 @@ class RealTimeDataMonitor:
         """
         Calculate and return statistics on the current data.
         
+        The result is cached until new data arrives, so repeated calls
+        between measurements are free. Treat it as read-only.
+        
         Returns:
             Dict: Statistics dictionary
         """
         if not self.data_buffer:
             return {}
         
+        if self._stats_cache is not None:
+            return self._stats_cache
+        
         # Calculate key statistics from the data buffer
         stats = {
             "count": len(self.data_buffer),
@@ -923,50 +1338,20 @@ class RealTimeDataMonitor:
             "ratios": {}
         }
         
-        # Extract data for key channels
-        channels = ["F1", "F4", "F8"]
-        channel_data = {ch: [] for ch in channels}
-        
-        # Extract data for key ratios
-        ratio_types = ["violet_red", "violet_green", "green_red"]
-        ratio_data = {r: [] for r in ratio_types}
-        
-        # Process all measurements
-        for measurement in self.data_buffer:
-            # Extract channel data
-            raw_data = measurement.get("raw", {})
-            for ch in channels:
-                if ch in raw_data:
-                    channel_data[ch].append(raw_data[ch])
-            
-            # Extract ratio data
-            ratios = measurement.get("ratios", {})
-            for r in ratio_types:
-                if r in ratios:
-                    ratio_data[r].append(ratios[r])
-        
-        # Calculate statistics for each channel
-        for ch in channels:
-            if channel_data[ch]:
-                values = channel_data[ch]
-                stats["channels"][ch] = {
-                    "mean": np.mean(values),
-                    "std": np.std(values),
-                    "min": np.min(values),
-                    "max": np.max(values),
-                    "count": len(values)
-                }
-        
-        # Calculate statistics for each ratio
-        for r in ratio_types:
-            if ratio_data[r]:
-                values = ratio_data[r]
-                stats["ratios"][r] = {
-                    "mean": np.mean(values),
-                    "std": np.std(values),
-                    "min": np.min(values),
-                    "max": np.max(values),
-                    "count": len(values)
-                }
-        
+        # Rows of the statistics columns that hold buffered measurements
+        n = min(self._n, self.buffer_size)
+        
+        for group, keys in (("channels", STAT_CHANNELS), ("ratios", STAT_RATIOS)):
+            for key in keys:
+                count, mean, std, low, high = _column_stats(self._soa[key][:n])
+                if count:
+                    stats[group][key] = {
+                        "mean": mean,
+                        "std": std,
+                        "min": low,
+                        "max": high,
+                        "count": count
+                    }
+        
+        self._stats_cache = stats
         return stats
\ No newline at end of file
@@ -54,5 +54,48 @@ def create_spectral_fingerprint(
     
     # Prepare data for heatmap
     wavelengths = [CHANNEL_WAVELENGTHS[ch] for ch in channels]
-    times = []
-    spectrum_matrix = []
\ No newline at end of file
+    raw_series = [m.get('raw', m) for m in data_series]
+    
+    # Time axis: timestamp, elapsed time, or measurement index
+    times = np.array([
+        m.get('timestamp', m.get('elapsed_seconds', i)) for i, m in enumerate(data_series)
+    ], dtype=float)
+    if times[0] > 1000000000:  # Unix timestamp check
+        times -= times[0]
+    
+    # One row per measurement, one column per channel; missing values are NaN
+    spectrum_matrix = np.array(
+        [[raw.get(ch, np.nan) for ch in channels] for raw in raw_series],
+        dtype=np.float32
+    )
+    
+    # Normalize each measurement by its reference channel in one broadcast
+    if normalize:
+        reference = np.array([raw.get(reference_channel, np.nan) for raw in raw_series],
+                             dtype=np.float32)
+        spectrum_matrix /= np.where(reference > 0, reference, 1.0)[:, np.newaxis]
+    
+    # Heatmap of the spectrum over time, channels from short to long wavelength
+    t_end = times[-1] if times[-1] > times[0] else times[0] + 1
+    im = ax1.imshow(spectrum_matrix.T, aspect='auto', origin='lower', cmap='viridis',
+                    extent=[times[0], t_end, -0.5, len(channels) - 0.5])
+    cbar = fig.colorbar(im, ax=ax1)
+    cbar.set_label(f'Intensity / {reference_channel}' if normalize else 'Signal Intensity')
+    
+    ax1.set_yticks(np.arange(len(channels)))
+    ax1.set_yticklabels([f"{ch} ({wl}nm)" for ch, wl in zip(channels, wavelengths)])
+    ax1.set_xlabel('Time (seconds)')
+    ax1.set_title(title or 'Spectral Fingerprint')
+    
+    # Spectral profiles at the start, middle and end of the series
+    for i in sorted({0, len(data_series) // 2, len(data_series) - 1}):
+        ax2.plot(wavelengths, spectrum_matrix[i], 'o-', alpha=0.8, linewidth=1.5,
+                 label=f"t = {times[i]:.1f}s")
+    
+    ax2.set_xlabel('Wavelength (nm)')
+    ax2.set_ylabel(f'Intensity / {reference_channel}' if normalize else 'Signal Intensity')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend()
+    
+    plt.tight_layout()
+    return fig
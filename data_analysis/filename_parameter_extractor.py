@@ -1,30 +1,98 @@
 import re
+import functools
 import pandas as pd
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 import argparse
 
 
+# Parameters returned by FilenameParser.parse_filename, in order
+PARAMETER_COLUMNS = (
+    'filename',
+    'date',
+    'date_raw',
+    'led_current_mA',
+    'gain',
+    'integration_time_ms',
+    'background_subtracted',
+    'bead_size_um',
+    'solids_concentration_percent',
+    'salt_concentration_percent',
+    'time_point_min',
+    'condition_id'
+)
+
+# Columns that identify a file rather than an experimental parameter
+NON_PARAMETER_COLUMNS = ('filename', 'date', 'date_raw', 'condition_id')
+
+
+def condition_label(condition_id: Optional[tuple]) -> Optional[str]:
+    """
+    Format a condition identifier for display.
+    
+    Args:
+        condition_id (tuple): (solids %, salt %) as in the 'condition_id' column, or None
+        
+    Returns:
+        str: Label such as "0.02%_solids_0.0%_salt", or None
+    """
+    if condition_id is None:
+        return None
+    solids, salt = condition_id
+    return f"{solids}%_solids_{salt}%_salt"
+
+
+def _salt_percent(value: str) -> float:
+    """Convert a salt concentration from a filename, where "no" means 0%."""
+    return 0.0 if value.lower() == 'no' else float(value)
+
+
 class FilenameParser:
     """
     Parser class for extracting parameters from measurement filenames.
     """
     
     def __init__(self):
-        # Define regex patterns for different parameters
+        # Define regex patterns for different parameters. Each captures its
+        # value in a group named after the parameter, so they can be joined
+        # into one pattern and found in a single scan of the filename.
         self.patterns = {
-            'date': r'(\d{6})_',
-            'current': r'I(\d+)mA',
-            'gain': r'G(\d+)_',
-            'integration_time': r'IT(\d+)ms',
-            'background_sub_yes': r'(?<!no_)(bckgnd_sub)',  # positive lookbehind to exclude "no_bckgnd_sub"
-            'background_sub_no': r'(no_bckgnd_sub)',
-            'bead_size': r'(\d+\.?\d*)um_beads',
-            'solids_concentration': r'(\d+\.?\d*)_soldids',
-            'salt_concentration': r'(\d+|no)_salt',
-            'time_point': r'(\d+)min\.csv'
+            'date': r'(?P<date>\d{6})_',
+            'current': r'I(?P<current>\d+)mA',
+            'gain': r'G(?P<gain>\d+)_',
+            'integration_time': r'IT(?P<integration_time>\d+)ms',
+            'bead_size': r'(?P<bead_size>\d+\.?\d*)um_beads',
+            'solids_concentration': r'(?P<solids_concentration>\d+\.?\d*)_soldids',
+            'salt_concentration': r'(?P<salt_concentration>\d+|no)_salt',
+            'time_point': r'(?P<time_point>\d+)min\.csv'
+        }
+        self.combined_pattern = re.compile('|'.join(self.patterns.values()))
+        
+        # Output key and value conversion for each parameter
+        self.fields = {
+            'date': ('date_raw', str),
+            'current': ('led_current_mA', int),
+            'gain': ('gain', int),
+            'integration_time': ('integration_time_ms', int),
+            'bead_size': ('bead_size_um', float),
+            'solids_concentration': ('solids_concentration_percent', float),
+            'salt_concentration': ('salt_concentration_percent', _salt_percent),
+            'time_point': ('time_point_min', int)
         }
+        
+        # Batches of measurements share a fixed header such as
+        # "250601_I20mA_G512_IT300ms_no_bckgnd_sub_". Its parameters are
+        # parsed once per header and only the rest of each filename is scanned.
+        # The header and its parameters are kept as one (header, params) tuple,
+        # so concurrent parses always see a matching pair.
+        self.header_pattern = re.compile(r'\d{6}_I\d+mA_G\d+_IT\d+ms_(?:no_)?bckgnd_sub_')
+        self._header_parse = None
+        
+        # Parsing is a pure function of the filename, so remember the results
+        # for filenames that are parsed again
+        self._parse_values = functools.lru_cache(maxsize=1 << 16)(self._parse_values)
     
     def parse_filename(self, filename: str) -> Dict[str, Union[str, float, int, bool]]:
         """
@@ -36,71 +104,77 @@ class FilenameParser:
         Returns:
             dict: Dictionary containing extracted parameters
         """
-        params = {'filename': filename}
-        
-        # Extract date
-        date_match = re.search(self.patterns['date'], filename)
-        if date_match:
-            date_str = date_match.group(1)
-            params['date'] = f"20{date_str[:2]}-{date_str[2:4]}-{date_str[4:6]}"
-            params['date_raw'] = date_str
-        else:
-            params['date'] = None
-            params['date_raw'] = None
-        
-        # Extract LED current (mA)
-        current_match = re.search(self.patterns['current'], filename)
-        params['led_current_mA'] = int(current_match.group(1)) if current_match else None
-        
-        # Extract gain
-        gain_match = re.search(self.patterns['gain'], filename)
-        params['gain'] = int(gain_match.group(1)) if gain_match else None
+        return dict(zip(PARAMETER_COLUMNS, self._parse_values(filename)))
+    
+    def _parse_values(self, filename: str) -> tuple:
+        """
+        Extract all parameters from a single filename.
         
-        # Extract integration time (ms)
-        it_match = re.search(self.patterns['integration_time'], filename)
-        params['integration_time_ms'] = int(it_match.group(1)) if it_match else None
+        Args:
+            filename (str): The filename to parse
+            
+        Returns:
+            tuple: Parameter values in the order of PARAMETER_COLUMNS
+        """
+        # Reuse the parse of the current header, or switch to this filename's
+        header_parse = self._header_parse
+        if header_parse is None or not filename.startswith(header_parse[0]):
+            header_match = self.header_pattern.match(filename)
+            if header_match:
+                header = header_match.group(0)
+                header_parse = (header, self._scan(header, dict.fromkeys(PARAMETER_COLUMNS)))
+                self._header_parse = header_parse
+            else:
+                header_parse = None
         
-        # Check background subtraction status
-        bg_yes_match = re.search(self.patterns['background_sub_yes'], filename)
-        bg_no_match = re.search(self.patterns['background_sub_no'], filename)
+        if header_parse is not None:
+            # No match can start in the header and run past it, so scanning
+            # the remainder finds the same parameters as a full scan
+            header, header_params = header_parse
+            params = self._scan(filename, dict(header_params), len(header))
+        else:
+            params = self._scan(filename, dict.fromkeys(PARAMETER_COLUMNS))
+        params['filename'] = filename
         
-        if bg_no_match:
+        # Check background subtraction status; "no_bckgnd_sub" contains "bckgnd_sub"
+        if 'no_bckgnd_sub' in filename:
             params['background_subtracted'] = False
-        elif bg_yes_match:
+        elif 'bckgnd_sub' in filename:
             params['background_subtracted'] = True
-        else:
-            params['background_subtracted'] = None  # Cannot determine from filename
-        
-        # Extract bead size (μm)
-        bead_match = re.search(self.patterns['bead_size'], filename)
-        params['bead_size_um'] = float(bead_match.group(1)) if bead_match else None
-        
-        # Extract solids concentration (%)
-        solids_match = re.search(self.patterns['solids_concentration'], filename)
-        params['solids_concentration_percent'] = float(solids_match.group(1)) if solids_match else None
-        
-        # Extract salt concentration (%)
-        salt_match = re.search(self.patterns['salt_concentration'], filename)
-        if salt_match:
-            salt_val = salt_match.group(1)
-            if salt_val.lower() == 'no':
-                params['salt_concentration_percent'] = 0.0
-            else:
-                params['salt_concentration_percent'] = float(salt_val)
-        else:
-            params['salt_concentration_percent'] = None
         
-        # Extract time point (minutes)
-        time_match = re.search(self.patterns['time_point'], filename)
-        params['time_point_min'] = int(time_match.group(1)) if time_match else None
+        # Format the date
+        date_str = params['date_raw']
+        if date_str is not None:
+            params['date'] = f"20{date_str[:2]}-{date_str[2:4]}-{date_str[4:6]}"
         
-        # Create a condition identifier for grouping
+        # Create a condition identifier for grouping; format it with condition_label
         if all(x is not None for x in [params['solids_concentration_percent'], 
                                       params['salt_concentration_percent']]):
-            params['condition_id'] = f"{params['solids_concentration_percent']}%_solids_{params['salt_concentration_percent']}%_salt"
+            params['condition_id'] = (params['solids_concentration_percent'], params['salt_concentration_percent'])
         else:
             params['condition_id'] = None
         
+        return tuple(params.values())
+    
+    def _scan(self, filename: str, params: Dict, pos: int = 0) -> Dict:
+        """
+        Fill in parameters found in a filename, from a given position on.
+        
+        Args:
+            filename (str): The filename to scan
+            params (dict): Parameters found so far, None where not yet found
+            pos (int): Position to start scanning at
+            
+        Returns:
+            dict: params, updated in place
+        """
+        # The first occurrence of each parameter wins
+        for match in self.combined_pattern.finditer(filename, pos):
+            name = match.lastgroup
+            key, convert = self.fields[name]
+            if params[key] is None:
+                params[key] = convert(match.group(name))
+        
         return params
     
     def parse_multiple_filenames(self, filenames: List[str]) -> pd.DataFrame:
@@ -113,27 +187,57 @@ class FilenameParser:
         Returns:
             pd.DataFrame: DataFrame with extracted parameters
         """
-        all_params = []
-        for filename in filenames:
-            params = self.parse_filename(filename)
-            all_params.append(params)
+        return self._build_dataframe([self._parse_values(filename) for filename in filenames])
+    
+    def _build_dataframe(self, rows: List[tuple]) -> pd.DataFrame:
+        """
+        Build a DataFrame from parsed parameter tuples.
+        
+        Args:
+            rows (list): Parameter values in the order of PARAMETER_COLUMNS, one tuple per file
+            
+        Returns:
+            pd.DataFrame: DataFrame with extracted parameters
+        """
+        # Transpose the rows into columns, the layout pandas stores
+        columns = zip(*rows) if rows else [[] for _ in PARAMETER_COLUMNS]
         
-        return pd.DataFrame(all_params)
+        return pd.DataFrame({
+            name: list(values) for name, values in zip(PARAMETER_COLUMNS, columns)
+        })
     
-    def parse_directory(self, directory_path: str, pattern: str = "*.csv") -> pd.DataFrame:
+    def parse_directory(self, directory_path: str, pattern: str = "*.csv",
+                        workers: Optional[int] = None) -> pd.DataFrame:
         """
         Parse all matching files in a directory.
         
         Args:
             directory_path (str): Path to directory containing files
             pattern (str): File pattern to match (default: "*.csv")
+            workers (int): Number of worker processes to parse with, or None to
+                parse in this process (default: None). Only worthwhile for very
+                large directories, since starting the processes costs more than
+                parsing a few thousand filenames.
             
         Returns:
             pd.DataFrame: DataFrame with extracted parameters
         """
-        path = Path(directory_path)
-        filenames = [f.name for f in path.glob(pattern)]
-        return self.parse_multiple_filenames(filenames)
+        if pattern.startswith('*.') and not any(c in pattern[1:] for c in '*?['):
+            # Plain extension match: list names directly, without building Paths
+            extension = os.path.normcase(pattern[1:])
+            with os.scandir(directory_path) as entries:
+                filenames = [entry.name for entry in entries
+                             if os.path.normcase(entry.name).endswith(extension)]
+        else:
+            path = Path(directory_path)
+            filenames = [f.name for f in path.glob(pattern)]
+        
+        if workers is None or workers <= 1:
+            return self.parse_multiple_filenames(filenames)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(_parse_in_worker, filenames, chunksize=256))
+        return self._build_dataframe(rows)
     
     def get_experiment_summary(self, df: pd.DataFrame) -> Dict:
         """
@@ -145,26 +249,81 @@ class FilenameParser:
         Returns:
             dict: Summary statistics
         """
-        summary = {}
-        
-        # Count unique values for each parameter
-        for col in df.columns:
-            if col not in ['filename', 'date', 'date_raw', 'condition_id']:
-                unique_vals = df[col].dropna().unique()
-                summary[col] = {
-                    'unique_values': sorted(unique_vals.tolist()) if len(unique_vals) > 0 else [],
-                    'count': len(unique_vals)
-                }
+        # Count unique values for each parameter, one hash pass per column
+        unique_vals = {
+            col: df[col].dropna().unique() for col in df.columns if col not in NON_PARAMETER_COLUMNS
+        }
+        summary = {
+            col: {'unique_values': sorted(vals.tolist()), 'count': len(vals)}
+            for col, vals in unique_vals.items()
+        }
         
-        # Group by experimental conditions
+        # Group by experimental conditions, in order of first appearance
         if 'condition_id' in df.columns:
-            condition_groups = df.groupby('condition_id').agg({
+            condition_groups = df.groupby('condition_id', sort=False).agg({
                 'time_point_min': list,
                 'filename': 'count'
             }).to_dict('index')
             summary['experimental_conditions'] = condition_groups
         
         return summary
+    
+    def summarize_filenames(self, filenames: List[str]) -> Dict:
+        """
+        Generate a summary of experimental conditions directly from filenames.
+        
+        Gives the same summary as get_experiment_summary on the DataFrame from
+        parse_multiple_filenames, without building the DataFrame. Missing time
+        points are listed as None rather than NaN.
+        
+        Args:
+            filenames (list): List of filenames to summarize
+            
+        Returns:
+            dict: Summary statistics
+        """
+        parameter_columns = [
+            (i, col) for i, col in enumerate(PARAMETER_COLUMNS) if col not in NON_PARAMETER_COLUMNS
+        ]
+        time_point_index = PARAMETER_COLUMNS.index('time_point_min')
+        condition_index = PARAMETER_COLUMNS.index('condition_id')
+        
+        unique_vals = {col: set() for _, col in parameter_columns}
+        conditions = {}
+        for filename in filenames:
+            values = self._parse_values(filename)
+            
+            # Collect unique values for each parameter
+            for i, col in parameter_columns:
+                if values[i] is not None:
+                    unique_vals[col].add(values[i])
+            
+            # Group by experimental conditions, in order of first appearance
+            condition_id = values[condition_index]
+            if condition_id is not None:
+                condition = conditions.setdefault(condition_id, {'time_point_min': [], 'filename': 0})
+                condition['time_point_min'].append(values[time_point_index])
+                condition['filename'] += 1
+        
+        summary = {
+            col: {'unique_values': sorted(vals), 'count': len(vals)}
+            for col, vals in unique_vals.items()
+        }
+        summary['experimental_conditions'] = conditions
+        
+        return summary
+
+
+# Parser of a parse_directory worker process, created on first use
+_worker_parser = None
+
+
+def _parse_in_worker(filename: str) -> tuple:
+    """Parse a filename in a parse_directory worker process."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = FilenameParser()
+    return _worker_parser._parse_values(filename)
 
 
 if __name__ == "__main__":
@@ -8,34 +8,52 @@ No classes, just simple functions to analyze your nephelometer data.
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
 import re
 
+# Optional Arrow CSV reader, faster than the pandas parser; falls back to pandas
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
+
+# All filename fields in one pattern, each in a group named after its
+# parameter, so a single scan of the filename finds them
+_RE_FIELDS = re.compile(
+    r'(?P<date>\d{6})_'
+    r'|I[=]?(?P<current_mA>\d+)mA'
+    r'|G[=]?(?P<gain>\d+)'
+    r'|IT[=]?(?P<integration_time_ms>\d+)ms'
+    r'|(?P<bead_size_um>\d+\.?\d*)um_beads'
+    r'|(?P<solids_percent>\d+\.?\d*)%_solids'
+    r'|(?P<salt_percent>\d+\.?\d*)%_salt'
+    r'|(?P<time_min>\d+)min\.csv'
+)
+
+# Parameters as (name, type), in the order they are reported; background
+# subtraction goes between the two groups
+_ACQUISITION_FIELDS = (('date', str), ('current_mA', int), ('gain', int), ('integration_time_ms', int))
+_SAMPLE_FIELDS = (('bead_size_um', float), ('solids_percent', float), ('salt_percent', float), ('time_min', int))
+
 
 def parse_filename(filename):
     """Extract parameters from filename."""
     params = {'filename': filename}
     
-    # Extract date
-    date_match = re.search(r'(\d{6})_', filename)
-    if date_match:
-        params['date'] = date_match.group(1)
-    
-    # Extract current
-    current_match = re.search(r'I[=]?(\d+)mA', filename)
-    if current_match:
-        params['current_mA'] = int(current_match.group(1))
-    
-    # Extract gain
-    gain_match = re.search(r'G[=]?(\d+)', filename)
-    if gain_match:
-        params['gain'] = int(gain_match.group(1))
+    # Scan once, keeping the first occurrence of each field
+    found = {}
+    for match in _RE_FIELDS.finditer(filename):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
     
-    # Extract integration time
-    it_match = re.search(r'IT[=]?(\d+)ms', filename)
-    if it_match:
-        params['integration_time_ms'] = int(it_match.group(1))
+    # Extract date, current, gain and integration time
+    for key, convert in _ACQUISITION_FIELDS:
+        if key in found:
+            params[key] = convert(found[key])
     
     # Background subtraction
     if 'no_bckgnd_sub' in filename:
@@ -43,65 +61,182 @@ def parse_filename(filename):
     elif 'bckgnd_sub' in filename:
         params['background_subtracted'] = True
     
-    # Extract bead size
-    bead_match = re.search(r'(\d+\.?\d*)um_beads', filename)
-    if bead_match:
-        params['bead_size_um'] = float(bead_match.group(1))
+    # Extract bead size, solids and salt concentration and time point
+    for key, convert in _SAMPLE_FIELDS:
+        if key in found:
+            params[key] = convert(found[key])
     
-    # Extract solids concentration
-    solids_match = re.search(r'(\d+\.?\d*)%_solids', filename)
-    if solids_match:
-        params['solids_percent'] = float(solids_match.group(1))
+    return params
+
+
+# Rows read per CSV chunk; bounds the memory used while loading a file
+CSV_CHUNK_ROWS = 100_000
+
+# Most CSV files read at the same time; parsing releases the GIL
+LOAD_WORKERS = 8
+
+# Directory for parquet copies of loaded data with ratios, reused between runs;
+# kept next to this script so it does not depend on the working directory
+CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+# Cached file sets kept; the least recently used beyond this are removed
+CACHE_ENTRIES = 8
+
+# Spectral channel columns are read as float32, halving the memory they use
+CHANNEL_DTYPES = {f'processed_F{i}': np.float32 for i in range(1, 9)}
+
+
+def _read_csv_arrow(file_path):
+    """Read a CSV file as (n_rows, columns) blocks with the Arrow CSV reader.
     
-    # Extract salt concentration
-    salt_match = re.search(r'(\d+\.?\d*)%_salt', filename)
-    if salt_match:
-        params['salt_percent'] = float(salt_match.group(1))
+    Column types are inferred from the first block as the pandas parser would
+    read them: timestamps and dates stay text and empty columns are floats.
+    Raises pa.ArrowInvalid when a later block does not fit those types.
+    """
+    column_types = {col: pa.from_numpy_dtype(dtype) for col, dtype in CHANNEL_DTYPES.items()}
+    reader = pa_csv.open_csv(file_path, convert_options=pa_csv.ConvertOptions(column_types=column_types))
+    schema = reader.schema
+    reader.close()
     
-    # Extract time point
-    time_match = re.search(r'(\d+)min\.csv', filename)
-    if time_match:
-        params['time_min'] = int(time_match.group(1))
+    for field in schema:
+        if pa.types.is_temporal(field.type):
+            column_types[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            column_types[field.name] = pa.float64()
     
-    return params
+    options = pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+    return [(batch.num_rows, {name: _arrow_values(column)
+                              for name, column in zip(batch.schema.names, batch.columns)})
+            for batch in pa_csv.open_csv(file_path, convert_options=options)]
+
+
+def _arrow_values(column):
+    """NumPy array of a numeric Arrow column, pandas array of any other."""
+    kind = column.type
+    if pa.types.is_integer(kind) or pa.types.is_floating(kind) or (
+            pa.types.is_boolean(kind) and column.null_count == 0):
+        return column.to_numpy(zero_copy_only=False)
+    # Text stays in a compact pandas string array instead of a str object per row
+    return column.to_pandas().array
+
+
+def _pandas_values(series):
+    """NumPy array of a numeric pandas column, pandas array of any other."""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iufb':
+        return series.to_numpy()
+    return series.array
+
+
+def _read_csv_blocks(file_path):
+    """Read a CSV file in chunks, keeping only the column arrays of each chunk."""
+    if pa is not None:
+        try:
+            blocks = _read_csv_arrow(file_path)
+        except pa.ArrowInvalid:
+            # Column types changed after the first block; let pandas infer them
+            blocks = None
+        if blocks:
+            return blocks
+    
+    # Without pyarrow, or for header-only files which pandas gives typed columns
+    
+    return [(len(chunk), {col: _pandas_values(chunk[col]) for col in chunk.columns})
+            for chunk in pd.read_csv(file_path, chunksize=CSV_CHUNK_ROWS, dtype=CHANNEL_DTYPES)]
+
+
+def _concat_columns(blocks):
+    """Stack (n_rows, columns) blocks column by column into one frame.
+    
+    Column values are arrays or scalars repeated over the block's rows;
+    columns a block lacks are filled with NaN. Each column is taken out of
+    the blocks once stacked, so its pieces can be freed as the frame grows.
+    """
+    names = dict.fromkeys(col for _, columns in blocks for col in columns)
+    combined = {}
+    for col in names:
+        pieces = [(n, columns.pop(col, None)) for n, columns in blocks]
+        present = [value for _, value in pieces if value is not None]
+        
+        if not all(isinstance(value, (np.ndarray, bool, int, float)) for value in present):
+            # Text columns and text parameters: combine them as pd.concat does,
+            # keeping pandas' string arrays and broadcasting text scalars
+            frames = [pd.DataFrame({} if value is None else {col: value}, index=pd.RangeIndex(n))
+                      for n, value in pieces]
+            combined[col] = pd.concat(frames, ignore_index=True)[col]
+            continue
+        
+        arrays = [None if value is None else value if isinstance(value, np.ndarray) else np.full(n, value)
+                  for n, value in pieces]
+        present = [a for a in arrays if a is not None]
+        kinds = {a.dtype.kind for a in present}
+        # Like pd.concat, keep non-numeric columns (flags, labels) as objects
+        # rather than letting NumPy coerce them to numbers
+        dtype = None if kinds <= set('iuf') or (len(present) == len(arrays) and len(kinds) == 1) else object
+        # Fill gaps at the column's own float precision, so float32 stays float32
+        fill = np.result_type(np.float32, *present) if kinds <= set('iuf') else np.float64
+        combined[col] = np.concatenate([
+            np.full(n, np.nan, dtype=fill) if a is None else a
+            for a, (n, _) in zip(arrays, blocks)
+        ], dtype=dtype)
+    # The stacked columns are new arrays already; don't copy them again
+    return pd.DataFrame(combined, copy=False)
+
+
+def _load_file(file_path):
+    """Load one CSV file as blocks that carry its filename parameters."""
+    file_blocks = _read_csv_blocks(file_path)
+    
+    # Parse filename and add parameters
+    params = parse_filename(Path(file_path).name)
+    return [(n, {**columns, **params}) for n, columns in file_blocks]
+
+
+def _categorize_conditions(data):
+    """Store the experimental condition columns of data as categoricals, in place."""
+    # Conditions take only a few distinct values; grouping by category codes is cheaper
+    for key in ('salt_percent', 'time_min'):
+        if key in data.columns:
+            data[key] = data[key].astype('category')
 
 
 def load_data(file_paths):
     """Load all CSV files and combine with parameters."""
-    all_data = []
+    blocks = []
+    n_files = 0
     
-    for file_path in file_paths:
-        path = Path(file_path)
-        if not path.exists():
-            print(f"Warning: {file_path} not found")
-            continue
+    # Read the files in parallel, but report on them in the order given
+    with ThreadPoolExecutor(max_workers=max(1, min(LOAD_WORKERS, len(file_paths)))) as pool:
+        loads = [pool.submit(_load_file, file_path) if Path(file_path).exists() else None
+                 for file_path in file_paths]
         
-        try:
-            # Load CSV
-            df = pd.read_csv(file_path)
-            print(f"Loaded {len(df)} rows from {path.name}")
-            
-            # Parse filename and add parameters
-            params = parse_filename(path.name)
-            for key, value in params.items():
-                df[key] = value
-            
-            all_data.append(df)
+        for file_path, load in zip(file_paths, loads):
+            path = Path(file_path)
+            if load is None:
+                print(f"Warning: {file_path} not found")
+                continue
             
-        except Exception as e:
-            print(f"Error loading {file_path}: {e}")
+            try:
+                file_blocks = load.result()
+                print(f"Loaded {sum(n for n, _ in file_blocks)} rows from {path.name}")
+                blocks.extend(file_blocks)
+                n_files += 1
+                
+            except Exception as e:
+                print(f"Error loading {file_path}: {e}")
     
-    if not all_data:
+    if not blocks:
         raise ValueError("No data loaded!")
     
-    combined_data = pd.concat(all_data, ignore_index=True)
-    print(f"\nTotal dataset: {len(combined_data)} measurements from {len(all_data)} files")
+    combined_data = _concat_columns(blocks)
+    _categorize_conditions(combined_data)
+    print(f"\nTotal dataset: {len(combined_data)} measurements from {n_files} files")
     return combined_data
 
 
 def calculate_ratios(data):
     """Calculate key spectral ratios."""
-    result = data.copy()
+    # Only the ratio columns are allocated; the frame is shallow-copied by assign
+    new_columns = {}
     
     # Define ratios to calculate
     ratios = {
@@ -113,45 +248,114 @@ def calculate_ratios(data):
     }
     
     for ratio_name, (num_col, den_col) in ratios.items():
-        if num_col in result.columns and den_col in result.columns:
-            # Calculate ratio, avoiding division by zero
-            mask = (result[den_col] != 0) & (result[den_col].notna()) & (result[num_col].notna())
-            result[ratio_name] = np.where(mask, result[num_col] / result[den_col], np.nan)
+        if num_col in data.columns and den_col in data.columns:
+            # Calculate ratio, only dividing where the denominator is non-zero;
+            # missing values are NaN and carry through the division
+            num = data[num_col].to_numpy(dtype=np.float32, na_value=np.nan)
+            den = data[den_col].to_numpy(dtype=np.float32, na_value=np.nan)
+            ratio = np.full(num.shape, np.nan, dtype=np.float32)
+            np.divide(num, den, out=ratio, where=(den != 0))
+            new_columns[ratio_name] = ratio
             print(f"Calculated {ratio_name}")
         else:
             print(f"Skipping {ratio_name} - missing columns ({num_col}, {den_col})")
     
-    return result
+    return data.assign(**new_columns)
+
+
+def calculate_ratio_means(data):
+    """Calculate the mean of each key ratio per (time, salt) condition."""
+    key_ratios = ['515nm_630nm', '445nm_630nm', '415nm_515nm']
+    present = [ratio for ratio in key_ratios if ratio in data.columns]
+    
+    # Keep conditions with missing keys, which lookups by value never match,
+    # so every condition present in the data has a row
+    return data.groupby(['time_min', 'salt_percent'], sort=False, dropna=False, observed=True)[present].mean()
+
+
+def load_data_cached(file_paths, cache_dir=CACHE_DIR):
+    """Load all CSV files and calculate ratios, reusing a parquet cache.
+    
+    The cache is keyed by the paths and modification times of the files, so
+    any change to the inputs loads and calculates them afresh. Only the
+    CACHE_ENTRIES most recently used entries are kept, and an entry that
+    cannot be read is rebuilt. Without pyarrow nothing is cached.
+    """
+    stamps = [f'{file_path}:{os.path.getmtime(file_path) if os.path.exists(file_path) else "missing"}'
+              for file_path in file_paths]
+    key = hashlib.md5(';'.join(stamps).encode()).hexdigest()
+    cache = Path(cache_dir) / f'{key}.parquet'
+    
+    if pa is not None and cache.exists():
+        try:
+            data = pd.read_parquet(cache)
+        except Exception as e:
+            print(f"Warning: could not read cached data from {cache}: {e}")
+        else:
+            print(f"Using cached data from {cache}")
+            # Mark the entry as recently used, so pruning keeps it
+            os.utime(cache)
+            # Parquet keeps the condition values but not their numeric categories
+            _categorize_conditions(data)
+            return data
+    
+    data = load_data(file_paths)
+    
+    print("\nCalculating spectral ratios...")
+    data = calculate_ratios(data)
+    
+    if pa is not None:
+        _write_cache(data, cache)
+    
+    return data
+
+
+def _write_cache(data, cache):
+    """Write data to a parquet cache entry and prune the oldest entries."""
+    # Write next to the entry and move it into place, so an interrupted run
+    # never leaves a partial file under the entry's name
+    partial = cache.with_name(f'{cache.stem}.{os.getpid()}.tmp')
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        data.to_parquet(partial)
+        os.replace(partial, cache)
+    except Exception as e:
+        print(f"Warning: could not cache data to {cache}: {e}")
+        partial.unlink(missing_ok=True)
+        return
+    
+    entries = sorted(cache.parent.glob('*.parquet'), key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for stale in entries[CACHE_ENTRIES:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
 
 
 def summarize_conditions(data):
     """Create summary statistics by condition."""
+    key_ratios = ['515nm_630nm', '445nm_630nm', '415nm_515nm']
+    present = [ratio for ratio in key_ratios if ratio in data.columns]
+    
     # Group by experimental conditions
-    summary_data = []
-    
-    for (salt, time), group in data.groupby(['salt_percent', 'time_min']):
-        condition = {
-            'salt_percent': salt,
-            'time_min': time,
-            'n_measurements': len(group)
-        }
-        
-        # Calculate stats for key ratios
-        key_ratios = ['515nm_630nm', '445nm_630nm', '415nm_515nm']
-        for ratio in key_ratios:
-            if ratio in group.columns:
-                values = group[ratio].dropna()
-                if len(values) > 0:
-                    condition[f'{ratio}_mean'] = values.mean()
-                    condition[f'{ratio}_std'] = values.std()
-                    condition[f'{ratio}_cv'] = (values.std() / values.mean() * 100) if values.mean() != 0 else np.nan
-        
-        summary_data.append(condition)
+    grouped = data.groupby(['salt_percent', 'time_min'], observed=True)
+    summary = grouped.size().to_frame('n_measurements')
+    
+    # Calculate stats for key ratios, for all conditions at once
+    if present:
+        stats = grouped[present].agg(['mean', 'std', 'count'])
+    for ratio in present:
+        if stats[(ratio, 'count')].any():
+            mean = stats[(ratio, 'mean')]
+            std = stats[(ratio, 'std')]
+            summary[f'{ratio}_mean'] = mean
+            summary[f'{ratio}_std'] = std
+            summary[f'{ratio}_cv'] = (std / mean * 100).where(mean != 0)
     
-    return pd.DataFrame(summary_data)
+    return summary.reset_index()
 
 
-def plot_analysis(data, save_path=None):
+def plot_analysis(data, save_path=None, ratio_means=None):
     """Create analysis plots."""
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
     fig.suptitle('Nephelometer Analysis', fontsize=16, fontweight='bold')
@@ -170,7 +374,7 @@ def plot_analysis(data, save_path=None):
     
     # 4. Salt effect
     ax4 = axes[1, 1]
-    plot_salt_effect(data, ax4)
+    plot_salt_effect(data, ax4, ratio_means)
     
     plt.tight_layout()
     
@@ -228,12 +432,12 @@ def plot_time_analysis(data, save_path=None):
     plt.show()
 
 
-def plot_salt_analysis(data, save_path=None):
+def plot_salt_analysis(data, save_path=None, ratio_means=None):
     """Create salt effect plot."""
     fig, ax = plt.subplots(1, 1, figsize=(10, 6))
     fig.suptitle('Immediate Salt Effect on Spectral Ratios', fontsize=14, fontweight='bold')
     
-    plot_salt_effect(data, ax)
+    plot_salt_effect(data, ax, ratio_means)
     
     plt.tight_layout()
     
@@ -250,46 +454,45 @@ def plot_spectral_channels(data, ax):
                 'processed_F5', 'processed_F6', 'processed_F7', 'processed_F8']
     wavelengths = [415, 445, 480, 515, 555, 590, 630, 680]
     
+    available = [(channel, wl) for channel, wl in zip(channels, wavelengths) if channel in data.columns]
+    available_channels = [channel for channel, _ in available]
+    available_wl = np.array([wl for _, wl in available])
+    
     # Get unique conditions and assign colors
-    conditions = data.groupby(['salt_percent', 'time_min']).size().index.tolist()
-    colors = plt.cm.tab10(np.linspace(0, 1, len(conditions)))
+    conditions = data.groupby(['salt_percent', 'time_min'], observed=True)
+    colors = plt.cm.tab10(np.linspace(0, 1, conditions.ngroups))
+    
+    # Individual measurements of all conditions, drawn in one scatter call
+    point_wl = []
+    point_intensities = []
+    point_colors = []
     
     # Plot for each condition
-    for i, (salt_pct, time_min) in enumerate(conditions):
-        group = data[(data['salt_percent'] == salt_pct) & (data['time_min'] == time_min)]
+    for i, ((salt_pct, time_min), group) in enumerate(conditions if available else []):
         color = colors[i]
         label = f'{salt_pct}% salt, {time_min} min'
         
-        # First, plot all individual measurements as scatter points
-        for _, row in group.iterrows():
-            intensities = []
-            wl_used = []
-            
-            for channel, wl in zip(channels, wavelengths):
-                if channel in row and not pd.isna(row[channel]):
-                    intensities.append(row[channel])
-                    wl_used.append(wl)
-            
-            if intensities:
-                # Plot individual points with transparency
-                ax.scatter(wl_used, intensities, color=color, alpha=0.4, s=30, zorder=1)
+        # First, collect all individual measurements as scatter points
+        intensities = group[available_channels].to_numpy(dtype=float)
+        measured = ~np.isnan(intensities)
+        point_wl.append(np.broadcast_to(available_wl, intensities.shape)[measured])
+        point_intensities.append(intensities[measured])
+        point_colors.append(np.tile(color, (measured.sum(), 1)))
         
         # Then, plot the mean line on top
-        mean_intensities = []
-        wl_used = []
-        
-        for channel, wl in zip(channels, wavelengths):
-            if channel in group.columns:
-                mean_intensity = group[channel].mean()
-                if not np.isnan(mean_intensity):
-                    mean_intensities.append(mean_intensity)
-                    wl_used.append(wl)
+        mean_intensities = group[available_channels].mean().to_numpy()
+        has_mean = ~np.isnan(mean_intensities)
         
-        if mean_intensities:
+        if has_mean.any():
             # Plot connected mean line with higher z-order to appear on top
-            ax.plot(wl_used, mean_intensities, 'o-', color=color, 
+            ax.plot(available_wl[has_mean], mean_intensities[has_mean], 'o-', color=color, 
                    linewidth=3, markersize=8, label=label, zorder=2)
     
+    if sum(len(wl) for wl in point_wl) > 0:
+        # Plot individual points with transparency
+        ax.scatter(np.concatenate(point_wl), np.concatenate(point_intensities),
+                   color=np.concatenate(point_colors), alpha=0.4, s=30, zorder=1)
+    
     ax.set_xlabel('Wavelength (nm)')
     ax.set_ylabel('Intensity (AU)')
     ax.set_title('Spectral Profile: Individual Measurements + Mean')
@@ -300,19 +503,25 @@ def plot_spectral_channels(data, ax):
 def plot_ratio_comparison(data, ax):
     """Plot key ratios as box plots."""
     # Prepare data for plotting
-    plot_data = []
-    
-    for _, row in data.iterrows():
-        condition = f"{row['salt_percent']}% salt\n{row['time_min']} min"
-        if '515nm_630nm' in row and not pd.isna(row['515nm_630nm']):
-            plot_data.append({
-                'Condition': condition,
-                '515nm/630nm Ratio': row['515nm_630nm']
-            })
-    
-    if plot_data:
-        plot_df = pd.DataFrame(plot_data)
-        sns.boxplot(data=plot_df, x='Condition', y='515nm/630nm Ratio', ax=ax)
+    if '515nm_630nm' in data.columns:
+        ratio_data = data[['salt_percent', 'time_min', '515nm_630nm']].dropna(subset=['515nm_630nm'])
+    else:
+        ratio_data = data.iloc[:0]
+    
+    if len(ratio_data) > 0:
+        # One array of ratios per condition, in order of appearance
+        labels = []
+        arrays = []
+        for (salt_pct, time_min), ratios in ratio_data.groupby(['salt_percent', 'time_min'], sort=False, dropna=False, observed=True)['515nm_630nm']:
+            labels.append(f'{salt_pct}% salt\n{time_min} min')
+            arrays.append(ratios.to_numpy())
+        
+        positions = np.arange(len(arrays))
+        ax.boxplot(arrays, positions=positions, widths=0.8, patch_artist=True,
+                   boxprops={'facecolor': 'C0'}, medianprops={'color': 'black'})
+        ax.set_xticks(positions, labels)
+        ax.set_xlabel('Condition')
+        ax.set_ylabel('515nm/630nm Ratio')
         ax.set_title('515nm/630nm Ratio by Condition')
         ax.tick_params(axis='x', rotation=45)
         ax.grid(True, alpha=0.3)
@@ -325,22 +534,27 @@ def plot_time_evolution(data, ax):
     key_ratios = ['515nm_630nm', '445nm_630nm', '415nm_515nm']
     colors = ['red', 'blue', 'green']
     
+    # Calculate mean and std of every ratio for each salt condition and time point at once
+    present = [ratio for ratio in key_ratios if ratio in data.columns]
+    if present:
+        stats = data.groupby(['salt_percent', 'time_min'], observed=True)[present].agg(['mean', 'std'])
+        salt_levels = stats.index.unique(level='salt_percent')
+        
+        # Salt conditions in order of appearance, looked up once for all ratios
+        salt_values = [salt_pct for salt_pct in data['salt_percent'].unique() if salt_pct in salt_levels]
+    
     for ratio, color in zip(key_ratios, colors):
-        if ratio in data.columns:
+        if ratio in present:
             # For each salt condition
-            for salt_pct in data['salt_percent'].unique():
-                salt_data = data[data['salt_percent'] == salt_pct]
+            for salt_pct in salt_values:
+                time_stats = stats.xs(salt_pct, level='salt_percent')
                 
-                # Calculate mean and std for each time point
-                time_stats = salt_data.groupby('time_min')[ratio].agg(['mean', 'std']).reset_index()
+                linestyle = '-' if salt_pct == 0 else '--'
+                label = f'{ratio.replace("_", "/")} ({salt_pct}% salt)'
                 
-                if len(time_stats) > 0:
-                    linestyle = '-' if salt_pct == 0 else '--'
-                    label = f'{ratio.replace("_", "/")} ({salt_pct}% salt)'
-                    
-                    ax.errorbar(time_stats['time_min'], time_stats['mean'], 
-                              yerr=time_stats['std'], marker='o', linewidth=2,
-                              label=label, color=color, linestyle=linestyle, capsize=5)
+                ax.errorbar(time_stats.index, time_stats[(ratio, 'mean')], 
+                          yerr=time_stats[(ratio, 'std')], marker='o', linewidth=2,
+                          label=label, color=color, linestyle=linestyle, capsize=5)
     
     ax.set_xlabel('Time (minutes)')
     ax.set_ylabel('Spectral Ratio')
@@ -349,12 +563,13 @@ def plot_time_evolution(data, ax):
     ax.grid(True, alpha=0.3)
 
 
-def plot_salt_effect(data, ax):
+def plot_salt_effect(data, ax, ratio_means=None):
     """Plot immediate salt effect on ratios."""
-    # Get t=0 data only
-    t0_data = data[data['time_min'] == 0]
+    if ratio_means is None:
+        ratio_means = calculate_ratio_means(data)
     
-    if len(t0_data) == 0:
+    # Check for t=0 data
+    if 0 not in ratio_means.index.get_level_values('time_min'):
         ax.text(0.5, 0.5, 'No t=0 data available', ha='center', va='center', transform=ax.transAxes)
         return
     
@@ -363,9 +578,9 @@ def plot_salt_effect(data, ax):
     effects = {}
     
     for ratio in key_ratios:
-        if ratio in t0_data.columns:
-            no_salt = t0_data[t0_data['salt_percent'] == 0][ratio].mean()
-            with_salt = t0_data[t0_data['salt_percent'] == 50][ratio].mean()
+        if ratio in ratio_means.columns:
+            no_salt = ratio_means[ratio].get((0, 0), np.nan)
+            with_salt = ratio_means[ratio].get((0, 50), np.nan)
             
             if not pd.isna(no_salt) and not pd.isna(with_salt) and no_salt != 0:
                 effect = ((with_salt - no_salt) / no_salt) * 100
@@ -391,26 +606,28 @@ def plot_salt_effect(data, ax):
         ax.text(0.5, 0.5, 'Cannot calculate salt effects', ha='center', va='center', transform=ax.transAxes)
 
 
-def analyze_agglutination(data):
+def analyze_agglutination(data, ratio_means=None):
     """Analyze agglutination by comparing time points."""
     print("\n" + "="*60)
     print("AGGLUTINATION ANALYSIS")
     print("="*60)
     
-    # Compare 0 min vs 5 min for each salt condition
-    for salt_pct in data['salt_percent'].unique():
-        salt_data = data[data['salt_percent'] == salt_pct]
-        
-        t0_data = salt_data[salt_data['time_min'] == 0]
-        t5_data = salt_data[salt_data['time_min'] == 5]
+    if ratio_means is None:
+        ratio_means = calculate_ratio_means(data)
+    
+    # Compare 0 min vs 5 min for each salt condition; measurements with an
+    # unknown salt level match no condition
+    for salt_pct in ratio_means.index.unique(level='salt_percent').dropna():
+        t0_key = (0, salt_pct)
+        t5_key = (5, salt_pct)
         
-        if len(t0_data) > 0 and len(t5_data) > 0:
+        if t0_key in ratio_means.index and t5_key in ratio_means.index:
             print(f"\n{salt_pct}% Salt Condition:")
             
             for ratio in ['515nm_630nm', '445nm_630nm', '415nm_515nm']:
-                if ratio in salt_data.columns:
-                    t0_mean = t0_data[ratio].mean()
-                    t5_mean = t5_data[ratio].mean()
+                if ratio in ratio_means.columns:
+                    t0_mean = ratio_means.loc[t0_key, ratio]
+                    t5_mean = ratio_means.loc[t5_key, ratio]
                     
                     if not pd.isna(t0_mean) and not pd.isna(t5_mean) and t0_mean != 0:
                         change = ((t5_mean - t0_mean) / t0_mean) * 100
@@ -426,40 +643,40 @@ def analyze_agglutination(data):
                         print(f"  {ratio}: {t0_mean:.4f} → {t5_mean:.4f} "
                             f"({change:+.1f}% change, {significance})")
 
-def analyze_salt_effect(data):
+def analyze_salt_effect(data, ratio_means=None):
     """Analyze immediate salt effect."""
     print("\n" + "="*60)
     print("SALT EFFECT ANALYSIS")
     print("="*60)
     
+    if ratio_means is None:
+        ratio_means = calculate_ratio_means(data)
+    
     # Compare no salt vs 50% salt at t=0
-    t0_data = data[data['time_min'] == 0]
+    no_salt = (0, 0)
+    with_salt = (0, 50)
     
-    if len(t0_data) > 0:
-        no_salt = t0_data[t0_data['salt_percent'] == 0]
-        with_salt = t0_data[t0_data['salt_percent'] == 50]
+    if no_salt in ratio_means.index and with_salt in ratio_means.index:
+        print(f"\nImmediate Salt Effect (t=0):")
         
-        if len(no_salt) > 0 and len(with_salt) > 0:
-            print(f"\nImmediate Salt Effect (t=0):")
-            
-            for ratio in ['515nm_630nm', '445nm_630nm', '415nm_515nm']:
-                if ratio in t0_data.columns:
-                    no_salt_mean = no_salt[ratio].mean()
-                    with_salt_mean = with_salt[ratio].mean()
+        for ratio in ['515nm_630nm', '445nm_630nm', '415nm_515nm']:
+            if ratio in ratio_means.columns:
+                no_salt_mean = ratio_means.loc[no_salt, ratio]
+                with_salt_mean = ratio_means.loc[with_salt, ratio]
+                
+                if not pd.isna(no_salt_mean) and not pd.isna(with_salt_mean) and no_salt_mean != 0:
+                    effect = ((with_salt_mean - no_salt_mean) / no_salt_mean) * 100
                     
-                    if not pd.isna(no_salt_mean) and not pd.isna(with_salt_mean) and no_salt_mean != 0:
-                        effect = ((with_salt_mean - no_salt_mean) / no_salt_mean) * 100
-                        
-                        # Assess significance
-                        if abs(effect) > 10:
-                            significance = "STRONG"
-                        elif abs(effect) > 5:
-                            significance = "MODERATE"
-                        else:
-                            significance = "MINIMAL"
-                        
-                        print(f"  {ratio.replace('_', '/')}: {no_salt_mean:.4f} → {with_salt_mean:.4f} "
-                              f"({effect:+.1f}% change, {significance})")
+                    # Assess significance
+                    if abs(effect) > 10:
+                        significance = "STRONG"
+                    elif abs(effect) > 5:
+                        significance = "MODERATE"
+                    else:
+                        significance = "MINIMAL"
+                    
+                    print(f"  {ratio.replace('_', '/')}: {no_salt_mean:.4f} → {with_salt_mean:.4f} "
+                          f"({effect:+.1f}% change, {significance})")
 
 
 def print_summary(data):
@@ -501,24 +718,24 @@ if __name__ == "__main__":
     
     # Load and process data
     print("Loading nephelometer data...")
-    data = load_data(files)
+    data = load_data_cached(files)
     
-    print("\nCalculating spectral ratios...")
-    data = calculate_ratios(data)
+    print("\nCalculating condition means...")
+    ratio_means = calculate_ratio_means(data)
     
     print("\nCreating analysis plots...")
-    plot_analysis(data, "nephelometer_simple_analysis.png")
+    plot_analysis(data, "nephelometer_simple_analysis.png", ratio_means)
 
     # Create individual plots
     plot_spectral_analysis(data, "spectral_analysis.png")
     plot_ratio_analysis(data, "ratio_analysis.png") 
     plot_time_analysis(data, "time_analysis.png")
-    plot_salt_analysis(data, "salt_analysis.png")
+    plot_salt_analysis(data, "salt_analysis.png", ratio_means)
     
     # Print analyses
     print_summary(data)
-    analyze_agglutination(data)
-    analyze_salt_effect(data)
+    analyze_agglutination(data, ratio_means)
+    analyze_salt_effect(data, ratio_means)
     
     print(f"\n{'='*60}")
     print("ANALYSIS COMPLETE")
@@ -10,9 +10,38 @@ Pre-calculated correction factors that account for both:
 Based on integrated spectral overlap calculations.
 """
 
+import math
 import numpy as np
 from scipy.interpolate import CubicSpline
 
+# Optional JIT compiler for the channel integrals; falls back to NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _channel_integrals(wavelengths, led_spectrum, centers, fwhms, peak_responses, out):
+    """
+    Trapezoidal integral of the LED spectrum times each channel's Gaussian
+    response, evaluating the response on the fly instead of storing it.
+    """
+    for j in range(centers.shape[0]):
+        # -0.5 / sigma**2, with sigma = fwhm / (2 * sqrt(2 * ln 2))
+        scale = -4.0 * math.log(2.0) / (fwhms[j] * fwhms[j])
+        d = wavelengths[0] - centers[j]
+        previous = peak_responses[j] * math.exp(scale * d * d) * led_spectrum[0]
+        total = 0.0
+        for i in range(1, wavelengths.shape[0]):
+            d = wavelengths[i] - centers[j]
+            current = peak_responses[j] * math.exp(scale * d * d) * led_spectrum[i]
+            total += 0.5 * (previous + current) * (wavelengths[i] - wavelengths[i - 1])
+            previous = current
+        out[j] = total
+    return out
+
+if njit is not None:
+    _channel_integrals = njit(_channel_integrals)
+
 def calculate_combined_correction_factors():
     """
     Calculate combined LED + AS7341 correction factors using integrated approach.
@@ -70,20 +99,24 @@ def calculate_combined_correction_factors():
     print("Calculating integrated LED × AS7341 responses...")
     print("=" * 60)
     
-    for ch in ['F1', 'F2', 'F3', 'F4', 'F5', 'F6', 'F7', 'F8']:
-        # Generate AS7341 channel response curve
-        center = channel_specs[ch]['center']
-        fwhm = channel_specs[ch]['fwhm']
-        peak = peak_responses_relative_to_f8[ch]
-        
-        as7341_response = gaussian_filter(wavelengths, center, fwhm, peak)
-        
-        # Calculate integrated response: ∫ LED(λ) × AS7341(λ) dλ
-        integrand = led_spectrum * as7341_response
-        integrated_response = np.trapz(integrand, wavelengths)
+    channels = ['F1', 'F2', 'F3', 'F4', 'F5', 'F6', 'F7', 'F8']
+    centers = np.array([channel_specs[ch]['center'] for ch in channels], dtype=np.float64)
+    fwhms = np.array([channel_specs[ch]['fwhm'] for ch in channels], dtype=np.float64)
+    peaks = np.array([peak_responses_relative_to_f8[ch] for ch in channels])
+    
+    # Calculate integrated responses of all channels at once: ∫ LED(λ) × AS7341(λ) dλ
+    if njit is not None:
+        integrals = _channel_integrals(wavelengths, led_spectrum, centers, fwhms, peaks, np.empty(len(channels)))
+    else:
+        # Generate AS7341 channel response curves, one row per channel
+        as7341_responses = gaussian_filter(wavelengths, centers[:, np.newaxis], fwhms[:, np.newaxis], peaks[:, np.newaxis])
+        integrals = np.trapezoid(led_spectrum * as7341_responses, wavelengths, axis=1)
+    
+    for ch, integrated_response in zip(channels, integrals):
         integrated_responses[ch] = integrated_response
         
-        print(f"{ch} ({center}nm, FWHM={fwhm}nm): Integrated response = {integrated_response:.3f}")
+        print(f"{ch} ({channel_specs[ch]['center']}nm, FWHM={channel_specs[ch]['fwhm']}nm): "
+              f"Integrated response = {integrated_response:.3f}")
     
     # === Calculate Correction Factors ===
     # Normalize to the channel with highest integrated response
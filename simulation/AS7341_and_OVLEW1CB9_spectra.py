@@ -1,29 +1,71 @@
+import math
 import numpy as np
 from scipy.interpolate import interp1d, CubicSpline
 import matplotlib.pyplot as plt
 
+# Optional JIT compiler for the channel response bank; falls back to NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 def channel_response(x, peak, fwhm, max_val=1.0):
     """
     Generate a gaussian-like response curve for a sensor channel,
     where the width parameter is the Full Width at Half Maximum (FWHM).
     """
     sigma = fwhm / (2 * np.sqrt(2 * np.log(2)))
-    return max_val * np.exp(-0.5 * ((x - peak) / sigma) ** 2)
+    # Evaluate max_val * exp(-0.5 * ((x - peak) / sigma) ** 2) in place
+    t = np.subtract(x, peak, dtype=np.result_type(x, np.float32))
+    t /= sigma
+    t *= t
+    t *= -0.5
+    np.exp(t, out=t)
+    t *= max_val
+    return t
+
+def _gauss_bank(x, peaks, fwhms, out):
+    """Fill row j of out with the gaussian response of channel j over x."""
+    for j in range(peaks.shape[0]):
+        # -0.5 / sigma**2, with sigma = fwhm / (2 * sqrt(2 * ln 2))
+        scale = -4.0 * math.log(2.0) / (fwhms[j] * fwhms[j])
+        for i in range(x.shape[0]):
+            d = x[i] - peaks[j]
+            out[j, i] = math.exp(scale * d * d)
+    return out
+
+if njit is not None:
+    _gauss_bank = njit(fastmath=True)(_gauss_bank)
 
-# Create wavelength range (350-1050 nm)
-wavelength = np.linspace(350, 1050, 1000)
+def channel_responses(x, peaks, fwhms):
+    """
+    Generate the response curves of several channels in one pass,
+    one row per (peak, fwhm) pair, as channel_response would.
+    """
+    peaks = np.asarray(peaks, dtype=np.float64)
+    fwhms = np.asarray(fwhms, dtype=np.float64)
+    if njit is None:
+        return channel_response(x, peaks[:, np.newaxis], fwhms[:, np.newaxis])
+    out = np.empty((peaks.shape[0], x.shape[0]), dtype=np.result_type(x, np.float32))
+    return _gauss_bank(x, peaks, fwhms, out)
+
+# Create wavelength range (350-1050 nm); single precision is ample for these curves
+wavelength = np.linspace(350, 1050, 1000, dtype=np.float32)
 
 # Create response curves for each channel
 # Parameters from AS7341data sheet (peak wavelength, width)
-f1 = channel_response(wavelength, 415, 26)  # Purple
-f2 = channel_response(wavelength, 445, 30)  # Dark blue
-f3 = channel_response(wavelength, 480, 36)  # Blue
-f4 = channel_response(wavelength, 515, 39)  # Cyan
-f5 = channel_response(wavelength, 555, 39)  # Green
-f6 = channel_response(wavelength, 590, 40)  # Yellow
-f7 = channel_response(wavelength, 630, 50)  # Orange
-f8 = channel_response(wavelength, 680, 52)  # Red
-nir = channel_response(wavelength, 910, 50)  # NIR - wider band, not really Gaussian though
+channels = [
+    (415, 26),  # F1 - Purple
+    (445, 30),  # F2 - Dark blue
+    (480, 36),  # F3 - Blue
+    (515, 39),  # F4 - Cyan
+    (555, 39),  # F5 - Green
+    (590, 40),  # F6 - Yellow
+    (630, 50),  # F7 - Orange
+    (680, 52),  # F8 - Red
+    (910, 50),  # NIR - wider band, not really Gaussian though
+]
+f1, f2, f3, f4, f5, f6, f7, f8, nir = channel_responses(wavelength, *zip(*channels))
 
 # Define the data points that can be roughly estimated from the graph in the AS7341 datasheet
 wavelength_data = np.array([
@@ -36,13 +78,9 @@ clear_data = np.array([
     0.39, 0.6, 0.8, 0.96, 0.99, 0.8, 0.38, 0.05
 ])
 
-# Create interpolation functions
-flicker_interp = CubicSpline(wavelength_data, flicker_data) 
-clear_interp = CubicSpline(wavelength_data, clear_data)
-
-# Interpolate the relative sensitivity values
-flicker = flicker_interp(wavelength)
-clear = clear_interp(wavelength)
+# Interpolate the relative sensitivity values, fitting both curves
+# with one spline since they share the same wavelengths
+flicker, clear = CubicSpline(wavelength_data, np.stack([flicker_data, clear_data]), axis=1)(wavelength).astype(np.float32)
 
 # Define the data points that can be roughly estimated from the graph in the OVLEW1CB9 datasheet
 wavelength_data = np.array([
@@ -53,11 +91,8 @@ intensity_data = np.array([
     0.0, 0.0, 0.02, 1.0, 0.18, 0.38, 0.25, 0.10, 0.05, 0.01, 0.0, 0.0, 0.0
 ])
 
-# Create interpolation functions
-intensity_interp = CubicSpline(wavelength_data, intensity_data) 
-
 # Interpolate the relative sensitivity values
-intensity = intensity_interp(wavelength)
+intensity = CubicSpline(wavelength_data, intensity_data)(wavelength).astype(np.float32)
 
 # Plot the graph
 plt.figure(figsize=(12, 8))
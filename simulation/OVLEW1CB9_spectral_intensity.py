@@ -2,8 +2,8 @@ import numpy as np
 from scipy.interpolate import interp1d, CubicSpline
 import matplotlib.pyplot as plt
 
-# Create wavelength range (350-1050 nm)
-wavelength = np.linspace(350, 1050, 1000)
+# Create wavelength range (350-1050 nm); single precision is ample for this curve
+wavelength = np.linspace(350, 1050, 1000, dtype=np.float32)
 
 # Define the data points that can be roughly estimated from the graph in the datasheet
 wavelength_data = np.array([
@@ -14,11 +14,8 @@ intensity_data = np.array([
     0.0, 0.0, 0.02, 1.0, 0.18, 0.38, 0.25, 0.10, 0.05, 0.01, 0.0, 0.0, 0.0
 ])
 
-# Create interpolation functions
-intensity_interp = CubicSpline(wavelength_data, intensity_data) 
-
 # Interpolate the relative sensitivity values
-intensity = intensity_interp(wavelength)
+intensity = CubicSpline(wavelength_data, intensity_data)(wavelength).astype(np.float32)
 
 # Plot the graph
 plt.figure(figsize=(12, 8))